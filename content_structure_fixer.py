@@ -3,8 +3,37 @@ Content Structure Fixer Module
 Fixes common structural issues in extracted content, particularly section-table associations
 """
 
+import logging
 from typing import Dict, List
-import re
+
+logger = logging.getLogger(__name__)
+
+
+def _section_prefix_kind(s: str) -> str:
+    """
+    Classify a numbered section prefix without going through the regex engine
+
+    Args:
+        s: Header or paragraph text
+
+    Returns:
+        'roman' for "I.", "II.", ..., 'arabic' for "1.", "2.", ..., else ''
+    """
+    s = s.lstrip()
+    dot = s.find('.')
+    if dot <= 0:
+        return ''
+    head = s[:dot]
+    if head.isdecimal():
+        return 'arabic'
+    if not head.strip('IVX'):
+        return 'roman'
+    return ''
+
+
+def _is_section_prefix(s: str) -> bool:
+    """Check whether text starts with a Roman or Arabic section number"""
+    return bool(_section_prefix_kind(s))
 
 
 class ContentStructureFixer:
@@ -38,14 +67,18 @@ class ContentStructureFixer:
         if len(items) < 2:
             return content
 
-        fixed_items = []
+        # Nothing to reorder on text-only pages
+        if not any(item.get('type') == 'table' for item in items):
+            return content
+
+        # Copied lazily on the first swap; pages that need no fix keep their list
+        fixed_items = None
+        swaps = 0
         i = 0
 
         while i < len(items):
-            current = items[i]
-
             # Check if current item is a table
-            if current.get('type') == 'table':
+            if items[i].get('type') == 'table':
                 # Look ahead for a section heading (within next 2 items)
                 section_header_idx = None
                 for j in range(i + 1, min(i + 3, len(items))):
@@ -53,38 +86,28 @@ class ContentStructureFixer:
                     if next_item.get('type') in ['header', 'paragraph']:
                         content_text = next_item.get('content', '')
                         # Check if it's a numbered section (I., II., III., etc.)
-                        if re.match(r'^[IVX]+\.|^\d+\.', content_text.strip()):
+                        if _is_section_prefix(content_text):
                             section_header_idx = j
                             break
 
-                # If we found a section header after the table, swap them
+                # If we found a section header after the table, swap them.
+                # Any item between the two stays where it is.
                 if section_header_idx is not None:
-                    print(f"  ⚙ Fixing: Moving section header before table")
-                    section_header = items[section_header_idx]
-
-                    # Add the section header first
-                    fixed_items.append(section_header)
-
-                    # Then add any items between table and header (if any)
-                    for k in range(i, section_header_idx):
-                        if k != i:  # Don't add the table yet
-                            fixed_items.append(items[k])
-
-                    # Finally add the table
-                    fixed_items.append(current)
+                    swaps += 1
+                    if fixed_items is None:
+                        fixed_items = list(items)
+                    fixed_items[i], fixed_items[section_header_idx] = \
+                        items[section_header_idx], items[i]
 
                     # Move index past all processed items
                     i = section_header_idx + 1
-                else:
-                    # No section header found, keep table as is
-                    fixed_items.append(current)
-                    i += 1
-            else:
-                # Not a table, keep as is
-                fixed_items.append(current)
-                i += 1
+                    continue
 
-        content['content_items'] = fixed_items
+            i += 1
+
+        if fixed_items is not None:
+            logger.info(f"  ⚙ Fixing: Moved {swaps} section header(s) before tables")
+            content['content_items'] = fixed_items
         return content
 
     def fix_header_hierarchy(self, content: Dict) -> Dict:
@@ -102,13 +125,13 @@ class ContentStructureFixer:
 
         for item in content['content_items']:
             if item.get('type') == 'header':
-                text = item.get('content', '')
+                kind = _section_prefix_kind(item.get('content', ''))
 
                 # Detect section numbers and assign appropriate levels
-                if re.match(r'^[IVX]+\.', text.strip()):
+                if kind == 'roman':
                     # Roman numeral sections (I., II., III.) → Level 2
                     item.setdefault('metadata', {})['level'] = 2
-                elif re.match(r'^\d+\.', text.strip()):
+                elif kind == 'arabic':
                     # Arabic numeral sections (1., 2., 3.) → Level 3
                     item.setdefault('metadata', {})['level'] = 3
                 else:
@@ -131,7 +154,13 @@ class ContentStructureFixer:
             return content
 
         items = content['content_items']
+
+        # Nothing to merge on text-only pages
+        if not any(item.get('type') == 'table' for item in items):
+            return content
+
         fixed_items = []
+        merges = 0
         i = 0
 
         while i < len(items):
@@ -150,16 +179,20 @@ class ContentStructureFixer:
                 next_y_start = next_pos.get('y_start', 100)
 
                 if abs(next_y_start - current_y_end) < 5:
-                    print(f"  ⚙ Merging adjacent tables")
+                    merges += 1
                     # Merge the tables
                     current_html = current.get('html', '')
                     next_html = items[i + 1].get('html', '')
 
                     # Simple merge: combine table bodies
                     # Remove closing </table> from first, opening <table> tags from second
-                    merged_html = current_html.replace('</table>', '')
-                    next_html_body = re.sub(r'^.*?<tbody>', '<tbody>', next_html, flags=re.DOTALL)
-                    merged_html += next_html_body
+                    table_end = current_html.rfind('</table>')
+                    if table_end != -1:
+                        current_html = current_html[:table_end]
+                    body_start = next_html.find('<tbody>')
+                    if body_start != -1:
+                        next_html = next_html[body_start:]
+                    merged_html = current_html + next_html
 
                     current['html'] = merged_html
                     current['position']['y_end'] = next_pos.get('y_end', current_y_end)
@@ -173,6 +206,8 @@ class ContentStructureFixer:
                 fixed_items.append(current)
                 i += 1
 
+        if merges:
+            logger.info(f"  ⚙ Merged {merges} pair(s) of adjacent tables")
         content['content_items'] = fixed_items
         return content
 
@@ -186,14 +221,14 @@ class ContentStructureFixer:
         Returns:
             Fixed content dictionary
         """
-        print(f"  🔧 Applying structural fixes...")
+        logger.debug("  🔧 Applying structural fixes...")
 
         # Apply fixes in order
         content = self.fix_section_table_order(content)
         content = self.fix_header_hierarchy(content)
         content = self.merge_split_tables(content)
 
-        print(f"  ✓ Structural fixes applied")
+        logger.info("  ✓ Structural fixes applied")
         return content
 
 
@@ -202,6 +237,8 @@ def main():
     import json
     import sys
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     if len(sys.argv) < 2:
         print("Usage: python content_structure_fixer.py <content.json>")
         sys.exit(1)
@@ -4,51 +4,83 @@ Recovers data from raw_response field
 """
 
 import json
+import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
-def fix_json_file(file_path):
-    """Fix a single JSON file"""
-    print(f"Processing: {file_path}")
+# orjson is C-backed and much faster for large extraction files; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+logger = logging.getLogger(__name__)
+
+# One-pass sanitizer: group 1 captures backslashes that don't start a valid
+# JSON escape sequence (doubled by the replacement); the other branch matches
+# C0/C1 control characters, which leave group 1 empty and are dropped
+_SANITIZE_RE = re.compile(r'(\\)(?!["\\/bfnrtu])|[\x00-\x1f\x7f-\x9f]')
+
+
+def _load_json(raw):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json(data, file_path):
+    """Write data as 2-space indented UTF-8 JSON"""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def fix_json_file(file_path, log=logger.info):
+    """Fix a single JSON file
+
+    Progress messages go through ``log`` so parallel callers can buffer them.
+    """
+    log(f"Processing: {file_path}")
+
+    with open(file_path, 'rb') as f:
+        data = _load_json(f.read())
 
     # Check if it has raw_response (indicating a parsing error)
     if 'raw_response' in data and data['raw_response']:
-        print(f"  Found raw_response, attempting to parse...")
+        log(f"  Found raw_response, attempting to parse...")
 
         raw_text = data['raw_response']
 
         try:
-            # Fix escape sequences
-            # Remove backslashes that aren't part of valid escape sequences
-            fixed_text = re.sub(r'\\(?!["\\/bfnrtu])', r'\\\\', raw_text)
-
-            # Remove control characters
-            fixed_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', fixed_text)
+            # Fix escape sequences and remove control characters in one scan
+            fixed_text = _SANITIZE_RE.sub(r'\1\1', raw_text)
 
             # Try to parse
-            parsed_data = json.loads(fixed_text)
+            parsed_data = _load_json(fixed_text)
 
             # Update the file with parsed data
             parsed_data['page_num'] = data['page_num']
 
             # Save back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(parsed_data, f, indent=2, ensure_ascii=False)
+            _dump_json(parsed_data, file_path)
 
-            print(f"  ✓ Fixed! Extracted {len(parsed_data.get('tables', []))} tables, "
+            log(f"  ✓ Fixed! Extracted {len(parsed_data.get('tables', []))} tables, "
                   f"{len(parsed_data.get('images', []))} images, "
                   f"{len(parsed_data.get('text_blocks', []))} text blocks")
             return True
 
         except Exception as e:
-            print(f"  ✗ Could not fix: {e}")
+            log(f"  ✗ Could not fix: {e}")
             return False
     else:
-        print(f"  ℹ  File is OK (no raw_response field)")
+        log(f"  ℹ  File is OK (no raw_response field)")
         return True
 
 def fix_directory(directory):
@@ -57,24 +89,34 @@ def fix_directory(directory):
     json_files = list(directory.glob("*.json"))
 
     if not json_files:
-        print(f"No JSON files found in {directory}")
+        logger.info(f"No JSON files found in {directory}")
         return
 
-    print(f"\nFound {len(json_files)} JSON files\n")
+    logger.info(f"\nFound {len(json_files)} JSON files\n")
 
     fixed = 0
     errors = 0
 
-    for json_file in json_files:
-        if fix_json_file(json_file):
-            fixed += 1
-        else:
-            errors += 1
-        print()
+    def fix_buffered(json_file):
+        """Fix one file, collecting its messages instead of printing them"""
+        lines = []
+        return fix_json_file(json_file, log=lines.append), lines
+
+    # Files are independent and mostly I/O bound; output is logged per file in order
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(json_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for ok, lines in executor.map(fix_buffered, json_files):
+            logger.info('\n'.join(lines) + '\n')
+            if ok:
+                fixed += 1
+            else:
+                errors += 1
 
-    print(f"\nSummary: {fixed} fixed, {errors} errors")
+    logger.info(f"\nSummary: {fixed} fixed, {errors} errors")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     if len(sys.argv) < 2:
         print("Usage: python fix_json_files.py <directory>")
         print("Example: python fix_json_files.py output/20251113_004401/extracted_content/")
@@ -3,11 +3,160 @@ HTML Formatter Module
 Reviews and adjusts HTML formatting for improved readability
 """
 
+import html
+import logging
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Tuple, Union
+import lxml.html
+
+logger = logging.getLogger(__name__)
+
+# Tokens scanned by review_html_file, which only needs counts and text lengths
+_TABLE_TOKEN_RE = re.compile(r'<(?P<close>/)?table\b(?P<attrs>[^>]*)>|<t[dh]\b', re.IGNORECASE)
+_DIV_TOKEN_RE = re.compile(r'<(?P<close>/)?div\b(?P<attrs>[^>]*)>', re.IGNORECASE)
+_P_TAG_RE = re.compile(r'<p\b', re.IGNORECASE)
+_ATTR_RE = re.compile(r'\b(?P<name>style|class)\s*=\s*(?P<quote>["\'])(?P<value>.*?)(?P=quote)',
+                      re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]*>')
+
+
+def _tag_attr(attrs: str, name: str) -> str:
+    """Return the value of a style/class attribute from a raw tag attribute string"""
+    for match in _ATTR_RE.finditer(attrs):
+        if match.group('name').lower() == name:
+            return match.group('value')
+    return ''
+
+
+@lru_cache(maxsize=1024)
+def _parse_style_frozen(style_str: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse a CSS style string into (property, value) pairs; cached since cell styles repeat"""
+    declarations = []
+    for rule in style_str.split(';'):
+        prop, sep, value = rule.partition(':')
+        if sep:
+            declarations.append((prop.strip(), value.strip()))
+    return tuple(declarations)
+
+
+def _text_length(fragment: str) -> int:
+    """Length of the stripped text nodes in an HTML fragment (as get_text(strip=True))"""
+    return sum(len(html.unescape(text).strip()) for text in _TAG_RE.split(fragment))
+
+
+# Content styling applied to header cells and to even/odd data rows
+_TH_STYLE_UPDATE = {
+    'padding': '10px',
+    'background-color': '#4a90e2',  # Professional blue
+    'color': 'white',
+    'font-weight': 'bold',
+    'text-align': 'left'
+}
+_TD_STYLE_UPDATES = (
+    {'padding': '10px', 'background-color': '#f9f9f9', 'line-height': '1.6'},
+    {'padding': '10px', 'background-color': '#ffffff', 'line-height': '1.6'},
+)
+
+# Serialized forms of the above, used as-is for cells without a style attribute
+_TH_STYLE = '; '.join(f'{k}: {v}' for k, v in _TH_STYLE_UPDATE.items())
+_TD_STYLES = tuple('; '.join(f'{k}: {v}' for k, v in update.items())
+                   for update in _TD_STYLE_UPDATES)
+
+# Properties the above override; existing declarations of these are dropped
+_TH_STYLE_KEYS = frozenset(_TH_STYLE_UPDATE)
+_TD_STYLE_KEYS = frozenset(_TD_STYLE_UPDATES[0])
+
+# Improved typography rules appended to the page stylesheet
+_TYPOGRAPHY_CSS = """
+        /* Improved Typography */
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
+            font-size: 14px;
+            color: #333;
+            line-height: 1.6;
+        }
+
+        h1, h2, h3, h4, h5, h6 {
+            margin-top: 20px;
+            margin-bottom: 10px;
+            font-weight: 600;
+            line-height: 1.3;
+            color: #2c3e50;
+        }
+
+        h1 { font-size: 2.2em; }
+        h2 { font-size: 1.8em; }
+        h3 { font-size: 1.5em; }
+        h4 { font-size: 1.3em; }
+
+        /* Better link styles */
+        a {
+            color: #4a90e2;
+            text-decoration: none;
+        }
+
+        a:hover {
+            text-decoration: underline;
+        }
+
+        /* Code and preformatted text */
+        code, pre {
+            font-family: 'Courier New', Courier, monospace;
+            background-color: #f5f5f5;
+            padding: 2px 4px;
+            border-radius: 3px;
+        }
+"""
+
+# Responsive and print rules appended to the page stylesheet
+_RESPONSIVE_CSS = """
+        /* Responsive Design */
+        @media screen and (max-width: 768px) {
+            .page {
+                width: 100% !important;
+                height: auto !important;
+                min-height: 100vh;
+            }
+
+            table {
+                font-size: 10pt !important;
+                display: block;
+                overflow-x: auto;
+                white-space: nowrap;
+            }
+
+            .text-block {
+                position: relative !important;
+                width: 100% !important;
+                left: 0 !important;
+            }
+
+            .table-container {
+                position: relative !important;
+                width: 100% !important;
+                left: 0 !important;
+            }
+        }
+
+        /* Print styles */
+        @media print {
+            body {
+                background-color: white;
+                padding: 0;
+            }
+
+            .page {
+                box-shadow: none;
+                margin: 0;
+            }
+        }
+"""
+
+_EXTRA_CSS = _TYPOGRAPHY_CSS + _RESPONSIVE_CSS
 
 
 class HTMLFormatter:
@@ -16,6 +165,10 @@ class HTMLFormatter:
     def __init__(self):
         """Initialize HTML formatter"""
         self.improvements = []
+        # Merged cell styles keyed by the cell's existing style (and row parity);
+        # extracted tables repeat the same few styles across all their cells
+        self._th_style_cache: Dict[str, str] = {}
+        self._td_style_cache: Dict[Tuple[str, int], str] = {}
 
     def review_html_file(self, html_path: str) -> Dict:
         """
@@ -33,8 +186,6 @@ class HTMLFormatter:
         with open(html_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-
         review = {
             'file': html_path,
             'issues': [],
@@ -42,37 +193,62 @@ class HTMLFormatter:
             'statistics': {}
         }
 
-        # Analyze content
-        tables = soup.find_all('table')
-        text_blocks = soup.find_all(class_='text-block')
-        paragraphs = soup.find_all('p')
+        # Analyze content with a linear token scan; no parse tree is needed
+        # Tables: [style, cell count]; cells count toward every enclosing table
+        tables = []
+        open_tables = []
+        for match in _TABLE_TOKEN_RE.finditer(html_content):
+            if match.group('close'):
+                if open_tables:
+                    open_tables.pop()
+            elif match.group('attrs') is not None:
+                table = [_tag_attr(match.group('attrs'), 'style'), 0]
+                tables.append(table)
+                open_tables.append(table)
+            else:
+                for table in open_tables:
+                    table[1] += 1
+
+        # Text blocks: divs carrying the text-block class, matched to their closing tag
+        text_blocks = []
+        open_divs = []
+        for match in _DIV_TOKEN_RE.finditer(html_content):
+            if match.group('close'):
+                if open_divs:
+                    start, is_text_block = open_divs.pop()
+                    if is_text_block:
+                        text_blocks.append((start, html_content[start:match.start()]))
+            else:
+                classes = _tag_attr(match.group('attrs'), 'class').split()
+                open_divs.append((match.end(), 'text-block' in classes))
+        text_blocks.sort()
+
+        paragraph_count = len(_P_TAG_RE.findall(html_content))
 
         review['statistics'] = {
             'tables': len(tables),
             'text_blocks': len(text_blocks),
-            'paragraphs': len(paragraphs)
+            'paragraphs': paragraph_count
         }
 
         # Check table formatting
-        for i, table in enumerate(tables):
-            cells = table.find_all(['td', 'th'])
-            if cells:
+        for i, (style, cell_count) in enumerate(tables):
+            if cell_count:
                 # Check for small font sizes
-                style = table.get('style', '')
                 if 'font-size' in style and ('8pt' in style or '9pt' in style):
                     review['issues'].append(f'Table {i+1}: Font size too small')
                     review['suggestions'].append(f'Table {i+1}: Increase font size to at least 10pt')
 
                 # Check for dense content
-                if len(cells) > 50:
-                    review['issues'].append(f'Table {i+1}: Very dense with {len(cells)} cells')
+                if cell_count > 50:
+                    review['issues'].append(f'Table {i+1}: Very dense with {cell_count} cells')
                     review['suggestions'].append(f'Table {i+1}: Consider adding more padding and spacing')
 
         # Check text block formatting
-        for i, block in enumerate(text_blocks):
-            text = block.get_text(strip=True)
-            if len(text) > 500:
-                review['issues'].append(f'Text block {i+1}: Very long ({len(text)} chars)')
+        for i, (_, block) in enumerate(text_blocks):
+            text_length = _text_length(block)
+            if text_length > 500:
+                review['issues'].append(f'Text block {i+1}: Very long ({text_length} chars)')
                 review['suggestions'].append(f'Text block {i+1}: Consider breaking into smaller chunks')
 
         return review
@@ -94,96 +270,111 @@ class HTMLFormatter:
         with open(html_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
 
-        # Apply improvements
-        improved_html = self._improve_html_content(html_content)
+        # Apply improvements, serializing straight to UTF-8 bytes
+        improved_html = self._improve_html_content(html_content, encoding='utf-8')
 
         # Save to output
         if output_path is None:
             output_path = html_path
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'wb') as f:
             f.write(improved_html)
 
-        print(f"  ✓ Applied {len(self.improvements)} improvements to {Path(output_path).name}")
+        logger.info(f"  ✓ Applied {len(self.improvements)} improvements to {Path(output_path).name}")
 
         return output_path
 
-    def _improve_html_content(self, html_content: str) -> str:
+    def _improve_html_content(self, html_content: str,
+                              encoding: str = 'unicode') -> Union[str, bytes]:
         """
         Apply various readability improvements to HTML content
 
         Args:
             html_content: Original HTML content
+            encoding: 'unicode' to return str, or a codec name (e.g. 'utf-8') to return bytes
 
         Returns:
             Improved HTML content
         """
         self.improvements = []
 
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse HTML into an lxml tree (C-level parse, mutation and serialization)
+        root = lxml.html.document_fromstring(html_content)
+
+        # Collect every node the passes need in a single traversal
+        tables = []
+        style_tags = []
+        for element in root.iter('table', 'style'):
+            if element.tag == 'table':
+                tables.append(element)
+            else:
+                style_tags.append(element)
+        style_tag = style_tags[0] if style_tags else None
 
         # Apply improvements
-        self._improve_table_formatting(soup)
-        self._improve_text_spacing(soup)
-        self._improve_typography(soup)
-        self._add_responsive_css(soup)
+        self._improve_table_formatting(tables)
+        self._improve_text_spacing(root)
+        self._add_stylesheet_rules(style_tag)
 
-        return str(soup)
+        return lxml.html.tostring(root, encoding=encoding,
+                                  doctype=root.getroottree().docinfo.doctype)
 
-    def _improve_table_formatting(self, soup: BeautifulSoup):
+    def _improve_table_formatting(self, tables: List[lxml.html.HtmlElement]):
         """Improve table formatting for readability while preserving positioning"""
 
         # DO NOT modify table containers or table styles - they have absolute positioning
         # Only improve cell content (headers and data cells) for better readability
 
-        # Find all tables
-        tables = soup.find_all('table')
-
         for table in tables:
             # Improve header cells only
-            headers = table.find_all('th')
-            for th in headers:
-                th_style = self._parse_style_string(th.get('style', ''))
+            for th in table.iter('th'):
+                existing = th.get('style')
+                if not existing:
+                    th.set('style', _TH_STYLE)
+                    continue
+                style = self._th_style_cache.get(existing)
+                if style is None:
+                    # Only update content styling, not positioning
+                    style = self._augment_style(existing, _TH_STYLE, _TH_STYLE_KEYS)
+                    self._th_style_cache[existing] = style
+                th.set('style', style)
+
+            # Improve data cells only, walking rows so each cell gets its row
+            # parity for free; body rows alternate colors per tbody
+            cell_count = 0
+            striped_rows = set()
+            for tbody in table.iter('tbody'):
+                for row_index, tr in enumerate(tbody.iterchildren('tr')):
+                    striped_rows.add(tr)
+                    cell_count += self._improve_row_cells(tr, row_index % 2)
+
+            # Rows outside a tbody (e.g. in thead) count as even
+            for tr in table.iter('tr'):
+                if tr not in striped_rows:
+                    cell_count += self._improve_row_cells(tr, 0)
+
+            if cell_count:
+                self.improvements.append(f'Improved table with {cell_count} cells')
+
+    def _improve_row_cells(self, tr: lxml.html.HtmlElement, parity: int) -> int:
+        """Apply data-cell styling to the cells of one row, returning how many were styled"""
+        count = 0
+        for td in tr.iterchildren('td'):
+            count += 1
+            existing = td.get('style')
+            if not existing:
+                td.set('style', _TD_STYLES[parity])
+                continue
+            key = (existing, parity)
+            style = self._td_style_cache.get(key)
+            if style is None:
                 # Only update content styling, not positioning
-                th_style.update({
-                    'padding': '10px',
-                    'background-color': '#4a90e2',  # Professional blue
-                    'color': 'white',
-                    'font-weight': 'bold',
-                    'text-align': 'left'
-                })
-                th['style'] = self._dict_to_style_string(th_style)
-
-            # Improve data cells only
-            cells = table.find_all('td')
-            for i, td in enumerate(cells):
-                td_style = self._parse_style_string(td.get('style', ''))
-
-                # Determine row number for alternating colors
-                row = td.find_parent('tr')
-                row_index = 0
-                if row:
-                    tbody = row.find_parent('tbody')
-                    if tbody:
-                        rows = tbody.find_all('tr')
-                        row_index = rows.index(row)
-
-                # Alternate row colors
-                bg_color = '#f9f9f9' if row_index % 2 == 0 else '#ffffff'
+                style = self._augment_style(existing, _TD_STYLES[parity], _TD_STYLE_KEYS)
+                self._td_style_cache[key] = style
+            td.set('style', style)
+        return count
 
-                # Only update content styling, not positioning
-                td_style.update({
-                    'padding': '10px',
-                    'background-color': bg_color,
-                    'line-height': '1.6'
-                })
-                td['style'] = self._dict_to_style_string(td_style)
-
-            if cells:
-                self.improvements.append(f'Improved table with {len(cells)} cells')
-
-    def _improve_text_spacing(self, soup: BeautifulSoup):
+    def _improve_text_spacing(self, root: lxml.html.HtmlElement):
         """Improve text spacing for readability while preserving positioning"""
 
         # DO NOT modify text blocks or image containers - they have absolute positioning
@@ -195,138 +386,43 @@ class HTMLFormatter:
         # Skip paragraph modifications to preserve layout
         pass
 
-    def _improve_typography(self, soup: BeautifulSoup):
-        """Improve typography for readability"""
-
-        # Update body styles
-        style_tag = soup.find('style')
-        if style_tag:
-            css = style_tag.string or ''
-
-            # Add improved typography rules
-            typography_css = """
-        /* Improved Typography */
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
-            font-size: 14px;
-            color: #333;
-            line-height: 1.6;
-        }
-
-        h1, h2, h3, h4, h5, h6 {
-            margin-top: 20px;
-            margin-bottom: 10px;
-            font-weight: 600;
-            line-height: 1.3;
-            color: #2c3e50;
-        }
-
-        h1 { font-size: 2.2em; }
-        h2 { font-size: 1.8em; }
-        h3 { font-size: 1.5em; }
-        h4 { font-size: 1.3em; }
-
-        /* Better link styles */
-        a {
-            color: #4a90e2;
-            text-decoration: none;
-        }
-
-        a:hover {
-            text-decoration: underline;
-        }
-
-        /* Code and preformatted text */
-        code, pre {
-            font-family: 'Courier New', Courier, monospace;
-            background-color: #f5f5f5;
-            padding: 2px 4px;
-            border-radius: 3px;
-        }
-"""
-
-            style_tag.string = css + typography_css
-            self.improvements.append('Improved typography')
-
-    def _add_responsive_css(self, soup: BeautifulSoup):
-        """Add responsive CSS for better mobile experience"""
-
-        style_tag = soup.find('style')
-        if style_tag:
-            css = style_tag.string or ''
-
-            # Add responsive rules
-            responsive_css = """
-        /* Responsive Design */
-        @media screen and (max-width: 768px) {
-            .page {
-                width: 100% !important;
-                height: auto !important;
-                min-height: 100vh;
-            }
-
-            table {
-                font-size: 10pt !important;
-                display: block;
-                overflow-x: auto;
-                white-space: nowrap;
-            }
-
-            .text-block {
-                position: relative !important;
-                width: 100% !important;
-                left: 0 !important;
-            }
-
-            .table-container {
-                position: relative !important;
-                width: 100% !important;
-                left: 0 !important;
-            }
-        }
-
-        /* Print styles */
-        @media print {
-            body {
-                background-color: white;
-                padding: 0;
-            }
+    def _add_stylesheet_rules(self, style_tag: Optional[lxml.html.HtmlElement]):
+        """Append typography and responsive rules to the page stylesheet"""
 
-            .page {
-                box-shadow: none;
-                margin: 0;
-            }
-        }
-"""
-
-            style_tag.string = css + responsive_css
-            self.improvements.append('Added responsive CSS')
+        if style_tag is not None:
+            style_tag.text = (style_tag.text or '') + _EXTRA_CSS
+            self.improvements.extend(('Improved typography', 'Added responsive CSS'))
 
-    def _parse_style_string(self, style_str: str) -> Dict[str, str]:
-        """Parse CSS style string into dictionary"""
-        styles = {}
-        if not style_str:
-            return styles
+    def _augment_style(self, existing: str, suffix: str, override_keys: frozenset) -> str:
+        """
+        Append prebuilt declarations to a CSS style string
 
-        for rule in style_str.split(';'):
-            rule = rule.strip()
-            if ':' in rule:
-                prop, value = rule.split(':', 1)
-                styles[prop.strip()] = value.strip()
+        Args:
+            existing: Current style attribute value
+            suffix: Serialized declarations to append
+            override_keys: Properties set by the suffix; dropped from existing
 
-        return styles
+        Returns:
+            Combined style string
+        """
+        kept = [f'{prop}: {value}' for prop, value in _parse_style_frozen(existing)
+                if prop not in override_keys]
 
-    def _dict_to_style_string(self, style_dict: Dict[str, str]) -> str:
-        """Convert dictionary to CSS style string"""
-        return '; '.join(f'{k}: {v}' for k, v in style_dict.items())
+        if not kept:
+            return suffix
+        return '; '.join(kept) + '; ' + suffix
 
-    def batch_format_directory(self, directory: str, pattern: str = "*.html") -> List[str]:
+    def batch_format_directory(self, directory: str, pattern: str = "*.html",
+                               max_workers: Optional[int] = None) -> List[str]:
         """
         Format all HTML files in a directory
 
+        Files are independent, so they are formatted in parallel worker processes.
+
         Args:
             directory: Directory containing HTML files
             pattern: File pattern to match (default: *.html)
+            max_workers: Number of worker processes (default: CPU count)
 
         Returns:
             List of formatted file paths
@@ -339,25 +435,39 @@ class HTMLFormatter:
         html_files = list(dir_path.glob(pattern))
 
         if not html_files:
-            print(f"No HTML files found in {directory}")
+            logger.info(f"No HTML files found in {directory}")
             return []
 
-        print(f"\n📝 Formatting {len(html_files)} HTML files in {directory}...")
+        logger.info(f"\n📝 Formatting {len(html_files)} HTML files in {directory}...")
 
         formatted_files = []
 
-        for html_file in html_files:
+        if len(html_files) == 1:
+            # Not worth spinning up a process pool for a single file
             try:
-                output_path = self.apply_readability_improvements(str(html_file))
-                formatted_files.append(output_path)
+                formatted_files.append(self.apply_readability_improvements(str(html_files[0])))
             except Exception as e:
-                print(f"  ✗ Error formatting {html_file.name}: {str(e)}")
+                logger.error(f"  ✗ Error formatting {html_files[0].name}: {str(e)}")
+        else:
+            workers = min(max_workers or os.cpu_count() or 1, len(html_files))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_format_one, str(html_file)) for html_file in html_files]
+                for html_file, future in zip(html_files, futures):
+                    try:
+                        formatted_files.append(future.result())
+                    except Exception as e:
+                        logger.error(f"  ✗ Error formatting {html_file.name}: {str(e)}")
 
-        print(f"✓ Successfully formatted {len(formatted_files)} files")
+        logger.info(f"✓ Successfully formatted {len(formatted_files)} files")
 
         return formatted_files
 
 
+def _format_one(html_path: str) -> str:
+    """Format a single HTML file in place (process pool worker)"""
+    return HTMLFormatter().apply_readability_improvements(html_path)
+
+
 def main():
     """Test the HTML formatter"""
     import argparse
@@ -369,6 +479,8 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     formatter = HTMLFormatter()
     path = Path(args.path)
 
@@ -3,145 +3,59 @@ HTML Page Generator Module
 Generates HTML pages from extracted content preserving natural reading order
 """
 
+import heapq
+import io
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict
-import base64
-
-
-class HTMLPageGenerator:
-    def __init__(self, page_width: float = 612, page_height: float = 792):
-        """
-        Initialize HTML page generator
-
-        Args:
-            page_width: Page width in points (default: 612 = 8.5 inches)
-            page_height: Page height in points (default: 792 = 11 inches)
-        """
-        self.page_width = page_width
-        self.page_height = page_height
-        self._base64_cache = {}  # Cache for base64 encoded images (performance optimization)
-        self._cache_size_limit = 50  # Limit cache to prevent memory issues with many pages
-
-    def generate_page_html(self, content: Dict, page_info: Dict, output_path: str = None) -> str:
-        """
-        Generate HTML for a single page with extracted content
-
-        Args:
-            content: Extracted content from OpenAI (tables, images, text_blocks)
-            page_info: Page information from PDF converter (dimensions, etc.)
-            output_path: Path to save HTML file
-
-        Returns:
-            Path to the generated HTML file
-        """
-        page_num = content.get('page_num', 1)
-        print(f"\nGenerating HTML for page {page_num}...")
-
-        # Update page dimensions from page_info if available
-        if page_info:
-            self.page_width = page_info.get('original_width', self.page_width)
-            self.page_height = page_info.get('original_height', self.page_height)
-
-        # Determine output path first (needed for relative image paths)
-        if output_path is None:
-            output_dir = Path("output/html_pages")
-            output_dir.mkdir(exist_ok=True, parents=True)
-            output_path = output_dir / f"page_{page_num}.html"
-        else:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(exist_ok=True, parents=True)
-
-        # Generate HTML content using flow layout (respects content order)
-        # This ensures section headings appear before their tables
-        html_content = self._build_flow_html(content, page_info, str(output_path))
-
-        # Write HTML to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        print(f"  ✓ HTML saved to: {output_path}")
-        return str(output_path)
-
-    def _build_flow_html(self, content: Dict, page_info: Dict, html_output_path: str = None) -> str:
-        """Build complete HTML document with flow layout (respects content order)"""
-        page_num = content.get('page_num', 1)
-
-        # Update page dimensions
-        if page_info:
-            self.page_width = page_info.get('original_width', self.page_width)
-            self.page_height = page_info.get('original_height', self.page_height)
-
-        html_parts = [
-            '<!DOCTYPE html>',
-            '<html lang="en">',
-            '<head>',
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            f'    <title>Page {page_num}</title>',
-            self._generate_flow_css(),
-            '</head>',
-            '<body>',
-            '    <div class="page">',
-        ]
-
-        # Use flow layout body
-        page_body = self._build_page_body(content, page_info, html_output_path)
-        html_parts.append(page_body)
-
-        # Close HTML
-        html_parts.extend([
-            '    </div>',
-            '</body>',
-            '</html>'
-        ])
-
-        return '\n'.join(html_parts)
-
-    def _build_html(self, content: Dict, page_info: Dict, html_output_path: str = None) -> str:
-        """Build complete HTML document with absolute positioning from extracted content (DEPRECATED - use _build_flow_html)"""
-        page_num = content.get('page_num', 1)
-
-        html_parts = [
-            '<!DOCTYPE html>',
-            '<html lang="en">',
-            '<head>',
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            f'    <title>Page {page_num}</title>',
-            self._generate_css(),
-            '</head>',
-            '<body>',
-            '    <div class="page">',
-        ]
-
-        # Use absolute positioning from extracted content
-        # All elements conform to positional definitions from extraction
-
-        # Render text blocks with absolute positioning
-        for text_block in content.get('text_blocks', []):
-            html_parts.append(self._render_text_block(text_block))
-
-        # Render tables with absolute positioning
-        for table in content.get('tables', []):
-            html_parts.append(self._render_table(table))
-
-        # Render images with absolute positioning
-        for image in content.get('images', []):
-            html_parts.append(self._render_image(image, page_info))
-
-        # Close HTML
-        html_parts.extend([
-            '    </div>',
-            '</body>',
-            '</html>'
-        ])
-
-        return '\n'.join(html_parts)
-
-    def _generate_flow_css(self) -> str:
-        """Generate CSS for flow layout (prevents overlapping)"""
-        return '''    <style>
+from typing import BinaryIO, Dict, Iterable, List, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Buffer size for streaming generated HTML to disk
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Multi-page documents shorter than this render in-process (pool startup would dominate)
+_PARALLEL_MIN_PAGES = 4
+
+# Image read size for base64 encoding; a multiple of 3 so encoded chunks concatenate cleanly
+_B64_CHUNK_SIZE = 48 * 1024
+
+# MIME types for embedded image data URLs, keyed by lowercase extension
+_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml'
+}
+
+# Line templates for the absolute-positioned renderers (%s keeps str() output of coordinates)
+_TEXT_BLOCK_TMPL = '        <div class="%s" style="left: %spt; top: %spt;">%s</div>\n'
+_TABLE_TMPL = '        <div class="table-container" style="left: %spt; top: %spt; width: %spt;">\n'
+_TABLE_CAPTION_TMPL = '            <div class="image-caption" style="margin-bottom: 5px;">%s</div>\n'
+_IMG_PLACEHOLDER_TMPL = (
+    '        <div class="image-container" style="left: %spt; top: %spt; width: %spt; height: %spt; '
+    'background-color: #e0e0e0; border: 1px dashed #999;">\n'
+    '            <div style="display: flex; align-items: center; justify-content: center; height: 100%%; '
+    'font-size: 0.8em; color: #666; padding: 10px; text-align: center;">\n'
+    '                Image: %s\n'
+    '            </div>\n'
+    '        </div>\n'
+)
+_IMG_CAPTION_TMPL = '        <div class="image-caption" style="left: %spt; top: %spt; width: %spt;">%s</div>\n'
+
+# Line templates for the flow-layout renderers
+_FLOW_LINE_TMPL = '        %s\n'
+_FLOW_TABLE_CAPTION_TMPL = '            <div class="table-caption">%s</div>\n'
+_FLOW_LIST_ITEM_TMPL = '            <li>%s</li>\n'
+_FLOW_IMG_TMPL = '            <img src="%s" alt="%s" class="embedded-image" />\n'
+
+# Flow layout stylesheet; identical for every page
+_FLOW_CSS = '''    <style>
         * {
             margin: 0;
             padding: 0;
@@ -318,187 +232,11 @@ class HTMLPageGenerator:
         }
     </style>'''
 
-    def _preserve_newlines(self, text: str) -> str:
-        """
-        Preserve newlines by converting them to <br/> tags
-        NEVER collapse or trim newline characters
-        """
-        if not text:
-            return text
-        # Convert all newlines to <br/> tags to preserve them in HTML
-        return text.replace('\n', '<br/>\n')
 
-    def _add_line_breaks(self, text: str) -> str:
-        """
-        Preserve newlines from JSON content - NEVER modify the content
-        Keep exact same content as extracted in JSON file
-        """
-        if not text:
-            return text
-
-        # Only preserve existing newlines by converting to <br/> tags
-        # NEVER add new line breaks that weren't in the original content
-        return text.replace('\n', '<br/>\n')
-
-    def _render_text_block_flow(self, text_block: Dict) -> str:
-        """Render text block in flow layout (no absolute positioning)"""
-        block_type = text_block.get('type', 'paragraph')
-        content = text_block.get('content', '')
-        formatting = text_block.get('formatting', [])
-
-        # Apply formatting
-        formatted_content = content
-        if isinstance(formatting, dict):
-            if formatting.get('bold', False):
-                formatted_content = f'<strong>{formatted_content}</strong>'
-            if formatting.get('italic', False):
-                formatted_content = f'<em>{formatted_content}</em>'
-            if formatting.get('underline', False):
-                formatted_content = f'<u>{formatted_content}</u>'
-        elif isinstance(formatting, list):
-            if 'bold' in formatting:
-                formatted_content = f'<strong>{formatted_content}</strong>'
-            if 'italic' in formatting:
-                formatted_content = f'<em>{formatted_content}</em>'
-            if 'underline' in formatting:
-                formatted_content = f'<u>{formatted_content}</u>'
-
-        # Render based on type
-        if block_type == 'header':
-            level = text_block.get('level', 1)
-            level = max(1, min(6, level))
-            # Preserve newlines in headers
-            formatted_content = self._preserve_newlines(formatted_content)
-            return f'        <h{level}>{formatted_content}</h{level}>'
-        elif block_type == 'page_header':
-            # Preserve newlines in page headers
-            formatted_content = self._preserve_newlines(formatted_content)
-            return f'        <div class="page-header">{formatted_content}</div>'
-        elif block_type == 'page_footer':
-            # Preserve newlines in page footers
-            formatted_content = self._preserve_newlines(formatted_content)
-            return f'        <div class="page-footer">{formatted_content}</div>'
-        elif block_type == 'list':
-            items = text_block.get('items', [content])
-            list_html = '        <ul>\n'
-            for item in items:
-                # Preserve newlines in list items
-                item = self._preserve_newlines(item)
-                list_html += f'            <li>{item}</li>\n'
-            list_html += '        </ul>'
-            return list_html
-        else:
-            # Preserve newlines - keep exact same content as in JSON
-            formatted_content = self._preserve_newlines(formatted_content)
-            return f'        <p>{formatted_content}</p>'
-
-    def _render_table_flow(self, table: Dict) -> str:
-        """Render table in flow layout"""
-        # Support both content_items format (uses 'content') and legacy format (uses 'html')
-        table_html = table.get('html', table.get('content', ''))
-        caption = table.get('caption', '')
-
-        parts = ['        <div class="table-container">']
-        if caption:
-            # Preserve newlines in caption
-            caption = self._preserve_newlines(caption)
-            parts.append(f'            <div class="table-caption">{caption}</div>')
-        parts.append(f'            {table_html}')
-        parts.append('        </div>')
-
-        return '\n'.join(parts)
-
-    def _get_relative_image_path(self, image_path: str, html_path: str) -> str:
-        """
-        Calculate relative path from HTML file to image file
-        This allows images to be referenced without base64 encoding
-        """
-        if not image_path or not html_path:
-            return image_path
-
-        try:
-            from pathlib import Path
-            img_path = Path(image_path).resolve()
-            html_dir = Path(html_path).parent.resolve()
-
-            # Calculate relative path
-            rel_path = os.path.relpath(img_path, html_dir)
-
-            # Convert backslashes to forward slashes for HTML
-            rel_path = rel_path.replace('\\', '/')
-
-            return rel_path
-        except:
-            # Fallback to absolute path if relative calculation fails
-            return image_path
-
-    def _render_image_flow(self, image: Dict, page_info: Dict, html_output_path: str = None) -> str:
-        """
-        Render image in flow layout - EMBEDS ALL IMAGES
-        Extracts and embeds all visual content (charts, diagrams, shapes, photos, logos, everything)
-        Uses base64 embedding for self-contained HTML files (works on Streamlit Cloud)
-        """
-        description = image.get('description', 'Image')
-        caption = image.get('caption', '')
-        image_path = image.get('image_path', '')  # Path to extracted image
-        image_data = image.get('image_data', '')  # Base64 encoded image (legacy)
-
-        # Get image type from metadata
-        metadata = image.get('metadata', {})
-        image_type = metadata.get('image_type', 'unknown').lower()
-
-        parts = ['        <div class="image-container">']
-
-        # EMBED ALL IMAGES - no filtering, extract everything
-        if image_data:
-            # Legacy: Base64 embedded image
-            parts.append(f'            <img src="{image_data}" alt="{description}" class="embedded-image" />')
-            print(f"      ✓ Embedded image (legacy base64): {description[:50]}...")
-        elif image_path and os.path.exists(image_path):
-            # NEW: Embed as base64 for self-contained HTML (works on Streamlit Cloud)
-            base64_data = self.embed_image_as_base64(image_path)
-            if base64_data:
-                parts.append(f'            <img src="{base64_data}" alt="{description}" class="embedded-image" />')
-                print(f"      ✓ Embedded image as base64: {Path(image_path).name}")
-            else:
-                # Fallback to file reference if base64 encoding fails
-                if html_output_path:
-                    # Calculate relative path for portability
-                    rel_path = self._get_relative_image_path(image_path, html_output_path)
-                else:
-                    # Use absolute path as fallback
-                    rel_path = image_path.replace('\\', '/')
-                parts.append(f'            <img src="{rel_path}" alt="{description}" class="embedded-image" />')
-                print(f"      ⚠ Using file reference for: {Path(image_path).name}")
-        else:
-            # Fallback to placeholder with description if no image file available
-            # DEBUG: Show why image wasn't embedded
-            if not image_path:
-                print(f"      ⚠ No image_path for: {description}")
-            elif not os.path.exists(image_path):
-                print(f"      ⚠ Image file not found: {image_path}")
-
-            # Preserve newlines in description
-            description = self._preserve_newlines(description)
-            parts.extend([
-                '            <div class="image-placeholder">',
-                f'                <div class="image-description">{description}</div>',
-                f'                <div class="image-type-label">[{image_type.upper()}]</div>',
-                '            </div>'
-            ])
-
-        if caption:
-            # Preserve newlines in caption
-            caption = self._preserve_newlines(caption)
-            parts.append(f'            <div class="image-caption">{caption}</div>')
-
-        parts.append('        </div>')
-
-        return '\n'.join(parts)
-
-    def _generate_css(self) -> str:
-        """Generate CSS styles for the page with absolute positioning"""
-        return f'''    <style>
+@lru_cache(maxsize=32)
+def _css_for(page_width: float, page_height: float) -> str:
+    """Absolute-positioning stylesheet for a page size (cached; pages usually share one size)"""
+    return f'''    <style>
         * {{
             margin: 0;
             padding: 0;
@@ -517,8 +255,8 @@ class HTMLPageGenerator:
         .page {{
             background-color: white;
             position: relative;
-            width: {self.page_width}pt;
-            height: {self.page_height}pt;
+            width: {page_width}pt;
+            height: {page_height}pt;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             margin: 0 auto;
         }}
@@ -610,117 +348,476 @@ class HTMLPageGenerator:
         }}
     </style>'''
 
-    def _render_text_block(self, text_block: Dict) -> str:
-        """Render a text block with positioning"""
+
+# Single flow-layout page split around its page number; blank pages are served from these directly
+_FLOW_PAGE_HEAD = ('<!DOCTYPE html>\n'
+                   '<html lang="en">\n'
+                   '<head>\n'
+                   '    <meta charset="UTF-8">\n'
+                   '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+                   '    <title>Page ')
+_FLOW_PAGE_OPEN = '</title>\n' + _FLOW_CSS + '\n</head>\n<body>\n    <div class="page">\n'
+_FLOW_PAGE_CLOSE = ('    </div>\n'
+                    '</body>\n'
+                    '</html>')
+_EMPTY_FLOW_PAGE_TAIL = _FLOW_PAGE_OPEN + _FLOW_PAGE_CLOSE
+
+
+def _has_page_items(content: Dict) -> bool:
+    """Whether a page's content has anything to render"""
+    return bool(content.get('content_items') or content.get('text_blocks')
+                or content.get('tables') or content.get('images'))
+
+
+@lru_cache(maxsize=8192)
+def _br(text: str) -> str:
+    """Convert newlines to <br/> tags, keeping the newline itself (captions and headers repeat)"""
+    return text.replace('\n', '<br/>\n')
+
+
+# Rendering kind of each content_items type; other types are skipped
+_ITEM_KINDS = {
+    'header': 'text', 'paragraph': 'text', 'page_header': 'text',
+    'page_footer': 'text', 'list': 'text', 'caption': 'text',
+    'table': 'table', 'image': 'image'
+}
+
+# Sort key of (kind, item, position) render entries
+_POSITION_KEY = itemgetter(2)
+
+
+def _in_order(entries: List[tuple]) -> List[tuple]:
+    """Return render entries ordered by position, skipping the sort when already ordered"""
+    for i in range(1, len(entries)):
+        if entries[i][2] < entries[i - 1][2]:
+            return sorted(entries, key=_POSITION_KEY)
+    return entries
+
+
+# Inline formatting flags in wrapping order (innermost first) and their tags
+_FORMAT_TAGS = (('bold', 'strong'), ('italic', 'em'), ('underline', 'u'))
+
+
+def _formatting_key(formatting) -> tuple:
+    """Normalize dict or list formatting into a hashable tuple of applied flags"""
+    if not formatting:
+        return ()
+    if isinstance(formatting, dict):
+        return tuple(flag for flag, _ in _FORMAT_TAGS if formatting.get(flag, False))
+    if isinstance(formatting, list):
+        return tuple(flag for flag, _ in _FORMAT_TAGS if flag in formatting)
+    return ()
+
+
+@lru_cache(maxsize=8)
+def _format_wrappers(formatting_key: tuple) -> tuple:
+    """Opening and closing tag strings for a formatting key (first flag is innermost)"""
+    tags = [tag for flag, tag in _FORMAT_TAGS if flag in formatting_key]
+    return ''.join(f'<{tag}>' for tag in reversed(tags)), ''.join(f'</{tag}>' for tag in tags)
+
+
+@lru_cache(maxsize=2048)
+def _render_inline(block_type: str, content: str, level: int, formatting_key: tuple) -> str:
+    """
+    Render the positionless HTML of a text block (headers and footers repeat across pages)
+
+    Args:
+        block_type: 'header', 'page_header', 'page_footer' or anything else for a paragraph
+        content: Raw text content
+        level: Header level (only used for 'header')
+        formatting_key: Flags from _formatting_key()
+
+    Returns:
+        Inline HTML element with formatting applied and newlines preserved
+    """
+    if formatting_key:
+        open_tags, close_tags = _format_wrappers(formatting_key)
+        content = f'{open_tags}{content}{close_tags}'
+    if content:
+        content = _br(content)
+
+    if block_type == 'header':
+        return f'<h{level}>{content}</h{level}>'
+    if block_type == 'page_header':
+        return f'<div class="page-header">{content}</div>'
+    if block_type == 'page_footer':
+        return f'<div class="page-footer">{content}</div>'
+    return f'<p>{content}</p>'
+
+
+class HTMLPageGenerator:
+    def __init__(self, page_width: float = 612, page_height: float = 792):
+        """
+        Initialize HTML page generator
+
+        Args:
+            page_width: Page width in points (default: 612 = 8.5 inches)
+            page_height: Page height in points (default: 792 = 11 inches)
+        """
+        self.page_width = page_width
+        self.page_height = page_height
+        self._base64_cache = {}  # Cache for base64 encoded images (performance optimization)
+        self._cache_size_limit = 50  # Limit cache to prevent memory issues with many pages
+        self._existing_images = set()  # Image paths already seen on disk (skips repeated stat calls)
+        self._dir_listings: Dict[str, frozenset] = {}  # Image directory -> file names, from one scandir each
+        self._dirs_created = set()  # Output directories already created by this generator
+        self._image_stats = {'embedded': 0, 'linked': 0, 'missing': 0}  # Per-page image outcome counts
+
+    def generate_page_html(self, content: Dict, page_info: Dict, output_path: str = None) -> str:
+        """
+        Generate HTML for a single page with extracted content
+
+        Args:
+            content: Extracted content from OpenAI (tables, images, text_blocks)
+            page_info: Page information from PDF converter (dimensions, etc.)
+            output_path: Path to save HTML file
+
+        Returns:
+            Path to the generated HTML file
+        """
+        page_num = content.get('page_num', 1)
+        logger.debug("Generating HTML for page %s...", page_num)
+
+        # Determine output path first (needed for relative image paths)
+        if output_path is None:
+            output_path = Path("output/html_pages") / f"page_{page_num}.html"
+        else:
+            output_path = Path(output_path)
+        self._ensure_dir(output_path.parent)
+
+        # Generate HTML content using flow layout (respects content order)
+        # This ensures section headings appear before their tables
+        html_content = self._build_flow_html(content, page_info, str(output_path))
+
+        # Write HTML to file
+        with open(output_path, 'wb') as f:
+            f.write(html_content.encode('utf-8'))
+
+        logger.info(f"  ✓ HTML saved to: {output_path}")
+        return str(output_path)
+
+    def _ensure_dir(self, directory: Path):
+        """Create an output directory once per generator instead of on every write"""
+        key = str(directory)
+        if key not in self._dirs_created:
+            directory.mkdir(exist_ok=True, parents=True)
+            self._dirs_created.add(key)
+
+    def _build_flow_html(self, content: Dict, page_info: Dict, html_output_path: str = None) -> str:
+        """Build complete HTML document with flow layout (respects content order)"""
+        page_num = content.get('page_num', 1)
+
+        # Blank pages need no rendering at all
+        if not _has_page_items(content):
+            return f'{_FLOW_PAGE_HEAD}{page_num}{_EMPTY_FLOW_PAGE_TAIL}'
+
+        out = io.StringIO()
+        out.write(_FLOW_PAGE_HEAD)
+        out.write(str(page_num))
+        out.write(_FLOW_PAGE_OPEN)
+
+        # Use flow layout body
+        self._write_page_body(out, content, page_info, html_output_path)
+
+        # Close HTML
+        out.write(_FLOW_PAGE_CLOSE)
+
+        return out.getvalue()
+
+    def _build_html(self, content: Dict, page_info: Dict, html_output_path: str = None) -> str:
+        """Build complete HTML document with absolute positioning from extracted content (DEPRECATED - use _build_flow_html)"""
+        page_num = content.get('page_num', 1)
+        # Snapshot the generator's page size; renderers take it explicitly instead of reading self
+        page_size = (self.page_width, self.page_height)
+
+        out = io.StringIO()
+        out.write('<!DOCTYPE html>\n'
+                  '<html lang="en">\n'
+                  '<head>\n'
+                  '    <meta charset="UTF-8">\n'
+                  '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+                  f'    <title>Page {page_num}</title>\n')
+        out.write(_css_for(*page_size))
+        out.write('\n</head>\n'
+                  '<body>\n'
+                  '    <div class="page">\n')
+
+        # Use absolute positioning from extracted content
+        # All elements conform to positional definitions from extraction
+
+        # Render text blocks with absolute positioning
+        for text_block in content.get('text_blocks', []):
+            self._write_text_block(out, text_block, page_size)
+
+        # Render tables with absolute positioning
+        for table in content.get('tables', []):
+            self._write_table(out, table, page_size)
+
+        # Render images with absolute positioning
+        for image in content.get('images', []):
+            self._write_image(out, image, page_info, page_size)
+
+        # Close HTML
+        out.write('    </div>\n'
+                  '</body>\n'
+                  '</html>')
+
+        return out.getvalue()
+
+    def _generate_flow_css(self) -> str:
+        """Generate CSS for flow layout (prevents overlapping)"""
+        return _FLOW_CSS
+
+    def _preserve_newlines(self, text: str) -> str:
+        """
+        Preserve newlines by converting them to <br/> tags
+        NEVER collapse or trim newline characters
+        """
+        if not text:
+            return text
+        return _br(text)
+
+    # Kept as an alias; both names always did the same conversion
+    _add_line_breaks = _preserve_newlines
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_relative_image_path(image_path: str, html_path: str) -> str:
+        """
+        Calculate relative path from HTML file to image file
+        This allows images to be referenced without base64 encoding
+        """
+        if not image_path or not html_path:
+            return image_path
+
+        try:
+            # Lexical paths are enough here; abspath avoids the stat calls of resolve()
+            img_path = os.path.abspath(image_path)
+            html_dir = os.path.dirname(os.path.abspath(html_path))
+
+            # Calculate relative path
+            rel_path = os.path.relpath(img_path, html_dir)
+
+            # Convert backslashes to forward slashes for HTML
+            rel_path = rel_path.replace('\\', '/')
+
+            return rel_path
+        except:
+            # Fallback to absolute path if relative calculation fails
+            return image_path
+
+    def _scan_image_dirs(self, pages_content: List[Dict]):
+        """List each directory holding page images once, so existence checks become set lookups"""
+        dirs = set()
+        for content in pages_content:
+            items = content.get('content_items') or content.get('images') or []
+            for item in items:
+                image_path = item.get('image_path')
+                if image_path:
+                    dirs.add(os.path.dirname(image_path))
+
+        for directory in dirs - self._dir_listings.keys():
+            try:
+                with os.scandir(directory or '.') as entries:
+                    self._dir_listings[directory] = frozenset(entry.name for entry in entries)
+            except OSError:
+                continue
+
+    def _image_exists(self, image_path: str) -> bool:
+        """Check whether an image file exists, remembering files already found"""
+        if image_path in self._existing_images:
+            return True
+        listing = self._dir_listings.get(os.path.dirname(image_path))
+        if listing is not None and os.path.basename(image_path) in listing:
+            self._existing_images.add(image_path)
+            return True
+        # Not in a scanned listing; the file may have been written since, so ask the filesystem
+        if os.path.exists(image_path):
+            self._existing_images.add(image_path)
+            return True
+        return False
+
+    def _write_image_flow(self, out: TextIO, image: Dict, page_info: Dict, html_output_path: str = None):
+        """
+        Write image in flow layout - EMBEDS ALL IMAGES
+        Extracts and embeds all visual content (charts, diagrams, shapes, photos, logos, everything)
+        Uses base64 embedding for self-contained HTML files (works on Streamlit Cloud)
+        """
+        description = image.get('description', 'Image')
+        caption = image.get('caption', '')
+        image_path = image.get('image_path', '')  # Path to extracted image
+        image_data = image.get('image_data', '')  # Base64 encoded image (legacy)
+
+        write = out.write
+        write('        <div class="image-container">\n')
+
+        # EMBED ALL IMAGES - no filtering, extract everything
+        if image_data:
+            # Legacy: Base64 embedded image
+            write(_FLOW_IMG_TMPL % (image_data, description))
+            self._image_stats['embedded'] += 1
+            logger.debug("      ✓ Embedded image (legacy base64): %.50s...", description)
+        elif image_path and self._image_exists(image_path):
+            # NEW: Embed as base64 for self-contained HTML (works on Streamlit Cloud)
+            base64_data = self.embed_image_as_base64(image_path)
+            if base64_data:
+                write(_FLOW_IMG_TMPL % (base64_data, description))
+                self._image_stats['embedded'] += 1
+                logger.debug("      ✓ Embedded image as base64: %s", image_path)
+            else:
+                # Fallback to file reference if base64 encoding fails
+                if html_output_path:
+                    # Calculate relative path for portability
+                    rel_path = self._get_relative_image_path(image_path, html_output_path)
+                else:
+                    # Use absolute path as fallback
+                    rel_path = image_path.replace('\\', '/')
+                write(_FLOW_IMG_TMPL % (rel_path, description))
+                self._image_stats['linked'] += 1
+                logger.warning(f"      ⚠ Using file reference for: {os.path.basename(image_path)}")
+        else:
+            # Fallback to placeholder with description if no image file available
+            # DEBUG: Show why image wasn't embedded
+            self._image_stats['missing'] += 1
+            if not image_path:
+                logger.debug("      ⚠ No image_path for: %s", description)
+            else:
+                logger.warning(f"      ⚠ Image file not found: {image_path}")
+
+            # Get image type from metadata (only the placeholder shows it)
+            image_type = image.get('metadata', {}).get('image_type', 'unknown').lower()
+
+            # Preserve newlines in description
+            description = self._preserve_newlines(description)
+            write('            <div class="image-placeholder">\n'
+                  f'                <div class="image-description">{description}</div>\n'
+                  f'                <div class="image-type-label">[{image_type.upper()}]</div>\n'
+                  '            </div>\n')
+
+        if caption:
+            # Preserve newlines in caption
+            caption = self._preserve_newlines(caption)
+            write(f'            <div class="image-caption">{caption}</div>\n')
+
+        write('        </div>\n')
+
+    def _generate_css(self) -> str:
+        """Generate CSS styles for the page with absolute positioning"""
+        return _css_for(self.page_width, self.page_height)
+
+    def _write_text_block(self, out: TextIO, text_block: Dict, page_size: Tuple[float, float] = None):
+        """
+        Write a text block in flow layout, or positioned on the page when page_size is given
+
+        Args:
+            out: Output buffer
+            text_block: Text block or content item
+            page_size: (width, height) in points for absolute positioning; None for flow layout
+        """
         block_type = text_block.get('type', 'paragraph')
         content = text_block.get('content', '')
+        flow = page_size is None
+
+        # Inner HTML is shared by both layouts; only the wrapper differs
+        if block_type == 'list':
+            items = text_block.get('items', [content])
+            # Preserve newlines in list items
+            if flow:
+                inner = '<ul>\n' + ''.join(_FLOW_LIST_ITEM_TMPL % _br(str(item)) for item in items) + '        </ul>'
+            elif items:
+                inner = '<ul><li>' + '</li><li>'.join(_br(str(item)) for item in items) + '</li></ul>'
+            else:
+                inner = '<ul></ul>'
+        else:
+            level = text_block.get('level', 1) if block_type == 'header' else 0
+            if flow:
+                inline_type = block_type
+                if block_type == 'header':
+                    level = max(1, min(6, level))
+            else:
+                # Positioned pages have no page header/footer styles; anything but a header is a paragraph
+                inline_type = 'header' if block_type == 'header' else 'paragraph'
+            inner = _render_inline(inline_type, content, level,
+                                   _formatting_key(text_block.get('formatting', [])))
+
+        if flow:
+            out.write(_FLOW_LINE_TMPL % inner)
+            return
+
+        page_width, page_height = page_size
         position = text_block.get('position', 'top-left')
-        formatting = text_block.get('formatting', [])
 
         # Handle both string positions (old format) and dict positions (new format)
         if isinstance(position, dict):
             # New format with percentages
-            left = (position.get('x_start', 5) / 100) * self.page_width
-            top = (position.get('y_start', 5) / 100) * self.page_height
-            coords = {'left': left, 'top': top}
+            left = (position.get('x_start', 5) / 100) * page_width
+            top = (position.get('y_start', 5) / 100) * page_height
         else:
             # Old format with string like 'top-left'
-            coords = self._position_to_coordinates(position, 'text')
-
-        # Apply formatting - handle both list and dict formats
-        formatted_content = content
-        if isinstance(formatting, dict):
-            # New format: dict with boolean flags
-            if formatting.get('bold', False):
-                formatted_content = f'<strong>{formatted_content}</strong>'
-            if formatting.get('italic', False):
-                formatted_content = f'<em>{formatted_content}</em>'
-            if formatting.get('underline', False):
-                formatted_content = f'<u>{formatted_content}</u>'
-        elif isinstance(formatting, list):
-            # Old format: list of strings
-            if 'bold' in formatting:
-                formatted_content = f'<strong>{formatted_content}</strong>'
-            if 'italic' in formatting:
-                formatted_content = f'<em>{formatted_content}</em>'
-            if 'underline' in formatting:
-                formatted_content = f'<u>{formatted_content}</u>'
-
-        # Render based on type
+            coords = self._position_to_coordinates(position, 'text', page_width, page_height)
+            left, top = coords['left'], coords['top']
+
         if block_type == 'header':
-            level = text_block.get('level', 1)
-            # Preserve newlines in headers
-            formatted_content = self._preserve_newlines(formatted_content)
-            return f'        <div class="text-block header" style="left: {coords["left"]}pt; top: {coords["top"]}pt;"><h{level}>{formatted_content}</h{level}></div>'
+            css_class = 'text-block header'
         elif block_type == 'list':
-            items = text_block.get('items', [content])
-            # Preserve newlines in list items
-            list_html = '<ul>' + ''.join([f'<li>{self._preserve_newlines(item)}</li>' for item in items]) + '</ul>'
-            return f'        <div class="text-block" style="left: {coords["left"]}pt; top: {coords["top"]}pt;">{list_html}</div>'
+            css_class = 'text-block'
         else:
-            # Preserve newlines in paragraphs
-            formatted_content = self._preserve_newlines(formatted_content)
-            return f'        <div class="text-block {block_type}" style="left: {coords["left"]}pt; top: {coords["top"]}pt;"><p>{formatted_content}</p></div>'
-
-    def _render_table(self, table: Dict) -> str:
-        """Render a table with positioning"""
-        table_html = table.get('html', '')
-        position = table.get('position', {})
+            css_class = f'text-block {block_type}'
+        out.write(_TEXT_BLOCK_TMPL % (css_class, left, top, inner))
+
+    def _write_table(self, out: TextIO, table: Dict, page_size: Tuple[float, float] = None):
+        """Write a table in flow layout, or positioned on the page when page_size is given"""
         caption = table.get('caption', '')
 
-        # Calculate position in points
-        left = (position.get('left_percent', 5) / 100) * self.page_width
-        top = (position.get('top_percent', 5) / 100) * self.page_height
-        width = (position.get('width_percent', 90) / 100) * self.page_width
+        if page_size is None:
+            # Support both content_items format (uses 'content') and legacy format (uses 'html')
+            table_html = table['html'] if 'html' in table else table.get('content', '')
+            out.write('        <div class="table-container">\n')
+            caption_tmpl = _FLOW_TABLE_CAPTION_TMPL
+        else:
+            page_width, page_height = page_size
+            table_html = table.get('html', '')
+            position = table.get('position', {})
 
-        # Build table container
-        html_parts = [
-            f'        <div class="table-container" style="left: {left}pt; top: {top}pt; width: {width}pt;">'
-        ]
+            # Calculate position in points
+            left = (position.get('left_percent', 5) / 100) * page_width
+            top = (position.get('top_percent', 5) / 100) * page_height
+            width = (position.get('width_percent', 90) / 100) * page_width
+            out.write(_TABLE_TMPL % (left, top, width))
+            caption_tmpl = _TABLE_CAPTION_TMPL
 
         if caption:
             # Preserve newlines in caption
-            caption = self._preserve_newlines(caption)
-            html_parts.append(f'            <div class="image-caption" style="margin-bottom: 5px;">{caption}</div>')
+            out.write(caption_tmpl % self._preserve_newlines(caption))
 
-        html_parts.append(f'            {table_html}')
-        html_parts.append('        </div>')
+        out.write(f'            {table_html}\n')
+        out.write('        </div>\n')
 
-        return '\n'.join(html_parts)
-
-    def _render_image(self, image: Dict, page_info: Dict) -> str:
-        """Render an image with positioning"""
+    def _write_image(self, out: TextIO, image: Dict, page_info: Dict, page_size: Tuple[float, float]):
+        """Write an image placeholder positioned on a (width, height) page"""
+        page_width, page_height = page_size
         position = image.get('position', {})
         caption = image.get('caption', '')
         description = image.get('description', '')
 
         # Calculate position in points
-        left = (position.get('left_percent', 5) / 100) * self.page_width
-        top = (position.get('top_percent', 5) / 100) * self.page_height
-        width = (position.get('width_percent', 40) / 100) * self.page_width
-        height = (position.get('height_percent', 30) / 100) * self.page_height
+        left = (position.get('left_percent', 5) / 100) * page_width
+        top = (position.get('top_percent', 5) / 100) * page_height
+        width = (position.get('width_percent', 40) / 100) * page_width
+        height = (position.get('height_percent', 30) / 100) * page_height
 
         # Create placeholder for image
         # In actual implementation, this would reference extracted image files
-        placeholder_style = f"background-color: #e0e0e0; border: 1px dashed #999;"
-
-        html_parts = [
-            f'        <div class="image-container" style="left: {left}pt; top: {top}pt; width: {width}pt; height: {height}pt; {placeholder_style}">',
-            f'            <div style="display: flex; align-items: center; justify-content: center; height: 100%; font-size: 0.8em; color: #666; padding: 10px; text-align: center;">',
-            f'                Image: {description}',
-            '            </div>',
-            '        </div>'
-        ]
+        out.write(_IMG_PLACEHOLDER_TMPL % (left, top, width, height, description))
 
         if caption:
             # Preserve newlines in caption
             caption = self._preserve_newlines(caption)
             caption_top = top + height + 5
-            html_parts.append(f'        <div class="image-caption" style="left: {left}pt; top: {caption_top}pt; width: {width}pt;">{caption}</div>')
+            out.write(_IMG_CAPTION_TMPL % (left, caption_top, width, caption))
 
-        return '\n'.join(html_parts)
-
-    def _position_to_coordinates(self, position_str: str, element_type: str) -> Dict[str, float]:
+    def _position_to_coordinates(self, position_str: str, element_type: str,
+                                 page_width: float, page_height: float) -> Dict[str, float]:
         """Convert position string (e.g., 'top-left') to approximate coordinates"""
         # Parse position string
         parts = position_str.lower().split('-')
@@ -729,23 +826,23 @@ class HTMLPageGenerator:
 
         # Vertical positioning
         if v_pos == 'top':
-            top = self.page_height * 0.1
+            top = page_height * 0.1
         elif v_pos == 'middle':
-            top = self.page_height * 0.45
+            top = page_height * 0.45
         elif v_pos == 'bottom':
-            top = self.page_height * 0.75
+            top = page_height * 0.75
         else:
-            top = self.page_height * 0.1
+            top = page_height * 0.1
 
         # Horizontal positioning
         if h_pos == 'left':
-            left = self.page_width * 0.1
+            left = page_width * 0.1
         elif h_pos == 'center':
-            left = self.page_width * 0.25
+            left = page_width * 0.25
         elif h_pos == 'right':
-            left = self.page_width * 0.6
+            left = page_width * 0.6
         else:
-            left = self.page_width * 0.1
+            left = page_width * 0.1
 
         return {'left': left, 'top': top}
 
@@ -765,32 +862,31 @@ class HTMLPageGenerator:
             keys_to_remove = list(self._base64_cache.keys())[:10]
             for key in keys_to_remove:
                 del self._base64_cache[key]
-            print(f"  🧹 Cleared HTML base64 cache (was {self._cache_size_limit} items)")
+            logger.debug("  🧹 Cleared HTML base64 cache (was %d items)", self._cache_size_limit)
+
+        import base64  # Only needed when images are embedded
 
         try:
+            # Encode in chunks so the raw file is never held in memory alongside its encoding
+            encoded = io.StringIO()
             with open(image_path, 'rb') as img_file:
-                img_data = base64.b64encode(img_file.read()).decode('utf-8')
+                while chunk := img_file.read(_B64_CHUNK_SIZE):
+                    encoded.write(base64.b64encode(chunk).decode('ascii'))
+            img_data = encoded.getvalue()
 
             # Determine image format
-            ext = Path(image_path).suffix.lower()
-            mime_type = {
-                '.png': 'image/png',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.gif': 'image/gif',
-                '.svg': 'image/svg+xml'
-            }.get(ext, 'image/png')
+            mime_type = _MIME_TYPES.get(os.path.splitext(image_path)[1].lower(), 'image/png')
 
             result = f"data:{mime_type};base64,{img_data}"
             # Cache the result
             self._base64_cache[image_path] = result
             return result
         except Exception as e:
-            print(f"  ✗ Error embedding image: {str(e)}")
+            logger.error(f"  ✗ Error embedding image: {str(e)}")
             return ""
 
     def generate_multi_page_html(self, pages_content: List[Dict], pages_info: List[Dict],
-                                 output_path: str = None) -> str:
+                                 output_path: str = None, max_workers: int = None) -> str:
         """
         Generate a single HTML file with all pages
 
@@ -798,129 +894,172 @@ class HTMLPageGenerator:
             pages_content: List of extracted content for each page
             pages_info: List of page information
             output_path: Path to save the combined HTML
+            max_workers: Worker processes for page rendering (default: CPU count)
 
         Returns:
             Path to the generated HTML file
         """
-        print(f"\nGenerating multi-page HTML document...")
+        logger.info(f"\nGenerating multi-page HTML document ({len(pages_content)} pages)...")
 
         if output_path is None:
             output_path = Path("output/reconstructed_document.html")
         else:
             output_path = Path(output_path)
 
-        output_path.parent.mkdir(exist_ok=True, parents=True)
+        self._ensure_dir(output_path.parent)
 
-        # Generate individual page HTML strings
-        pages_html = []
-        for content, info in zip(pages_content, pages_info):
-            if info:
-                self.page_width = info.get('original_width', self.page_width)
-                self.page_height = info.get('original_height', self.page_height)
+        head, foot = io.StringIO(), io.StringIO()
+        self._write_multi_page_header(head)
+        self._write_multi_page_footer(foot)
 
-            page_body = self._build_page_body(content, info, str(output_path))
-            pages_html.append(page_body)
+        # Stream pages straight into a large binary write buffer instead of holding
+        # the whole document in memory; each page is encoded to UTF-8 in one call
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as out:
+            out.write(head.getvalue().encode('utf-8'))
 
-        # Combine into single document
-        html_content = self._build_multi_page_html(pages_html)
+            if len(pages_content) < _PARALLEL_MIN_PAGES or max_workers == 1:
+                self._scan_image_dirs(pages_content)
+                pages_html = (self._build_page_body(content, info, str(output_path))
+                              for content, info in zip(pages_content, pages_info))
+                self._write_pages(out, pages_html)
+            else:
+                # Pages are independent; render them in worker processes and write in order
+                tasks = [(content, info, str(output_path)) for content, info in zip(pages_content, pages_info)]
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    self._write_pages(out, executor.map(_render_one_page, tasks))
 
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            out.write(foot.getvalue().encode('utf-8'))
 
-        print(f"  ✓ Multi-page HTML saved to: {output_path}")
+        logger.info(f"  ✓ Multi-page HTML saved to: {output_path}")
         return str(output_path)
 
+    @staticmethod
+    def _write_pages(out: BinaryIO, pages_html: Iterable[str]):
+        """Write rendered page bodies, each wrapped in its page div, as UTF-8"""
+        for page_html in pages_html:
+            out.write(b'    <div class="page">\n')
+            out.write(page_html.encode('utf-8'))
+            out.write(b'    </div>\n')
+
     def _build_page_body(self, content: Dict, page_info: Dict, html_output_path: str = None) -> str:
         """Build HTML body content for a single page with flow layout (respects content_items order)"""
+        out = io.StringIO()
+        self._write_page_body(out, content, page_info, html_output_path)
+        return out.getvalue()
+
+    def _write_page_body(self, out: TextIO, content: Dict, page_info: Dict,
+                         html_output_path: str = None):
+        """Write HTML body content for a single page, one line-terminated element at a time"""
+        if not _has_page_items(content):
+            return
+        stats = self._image_stats
+        stats['embedded'] = stats['linked'] = stats['missing'] = 0
 
         # Use content_items if available (preserves corrected order from structure fixer)
-        if 'content_items' in content and content['content_items']:
+        content_items = content.get('content_items')
+        if content_items:
             all_items = []
-            for item in content['content_items']:
-                item_type = item.get('type', 'paragraph')
-                order = item.get('order', 999)
-
+            for item in content_items:
                 # Map content_item types to rendering types
-                if item_type in ['header', 'paragraph', 'page_header', 'page_footer', 'list', 'caption']:
-                    all_items.append(('text', item, order))
-                elif item_type == 'table':
-                    all_items.append(('table', item, order))
-                elif item_type == 'image':
-                    all_items.append(('image', item, order))
-
-            # Sort by order field (preserves structure fixer corrections)
-            all_items.sort(key=lambda x: x[2])
+                kind = _ITEM_KINDS.get(item.get('type', 'paragraph'))
+                if kind:
+                    all_items.append((kind, item, item.get('order', 999)))
+
+            # Order by order field (preserves structure fixer corrections)
+            all_items = _in_order(all_items)
         else:
             # Fallback to legacy format if content_items not available
-            all_items = []
-
+            text_items = []
             for text_block in content.get('text_blocks', []):
                 pos = text_block.get('position', {})
                 y_pos = pos.get('y_start', 0) if isinstance(pos, dict) else 0
-                all_items.append(('text', text_block, y_pos))
+                text_items.append(('text', text_block, y_pos))
 
+            table_items = []
             for table in content.get('tables', []):
                 pos = table.get('position', {})
                 y_pos = pos.get('top_percent', 0) if isinstance(pos, dict) else 0
-                all_items.append(('table', table, y_pos))
+                table_items.append(('table', table, y_pos))
 
+            image_items = []
             for image in content.get('images', []):
                 pos = image.get('position', {})
                 y_pos = pos.get('top_percent', 0) if isinstance(pos, dict) else 0
-                all_items.append(('image', image, y_pos))
+                image_items.append(('image', image, y_pos))
 
-            # Sort by vertical position
-            all_items.sort(key=lambda x: x[2])
+            # Merge the per-kind streams by vertical position; ties keep text, table, image order
+            all_items = heapq.merge(_in_order(text_items), _in_order(table_items),
+                                    _in_order(image_items), key=_POSITION_KEY)
 
         # Render in order using FLOW methods (prevents overlapping)
-        parts = []
+        write_text, write_table, write_image = self._write_text_block, self._write_table, self._write_image_flow
         for item_type, item, _ in all_items:
             if item_type == 'text':
-                parts.append(self._render_text_block_flow(item))
+                write_text(out, item)
             elif item_type == 'table':
-                parts.append(self._render_table_flow(item))
-            elif item_type == 'image':
-                parts.append(self._render_image_flow(item, page_info, html_output_path))
+                write_table(out, item)
+            else:
+                write_image(out, item, page_info, html_output_path)
 
-        return '\n'.join(parts)
+        # One summary per page instead of a line per image
+        if stats['embedded'] or stats['linked'] or stats['missing']:
+            logger.info(f"    🖼 Page {content.get('page_num', '?')} images: {stats['embedded']} embedded, "
+                        f"{stats['linked']} linked, {stats['missing']} placeholders")
 
     def _build_multi_page_html(self, pages_html: List[str]) -> str:
         """Build complete multi-page HTML document with flow layout"""
-        html_parts = [
-            '<!DOCTYPE html>',
-            '<html lang="en">',
-            '<head>',
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            '    <title>Reconstructed Document</title>',
-            self._generate_flow_css(),  # Use flow CSS instead of absolute positioning CSS
-            '    <style>',
-            '        .page {',
-            '            margin-bottom: 40px;',
-            '            page-break-after: always;',
-            '        }',
-            '        @media print {',
-            '            body { background-color: white; padding: 0; }',
-            '            .page { margin: 0; box-shadow: none; page-break-after: always; }',
-            '        }',
-            '    </style>',
-            '</head>',
-            '<body>',
-        ]
+        out = io.StringIO()
+        self._write_multi_page_header(out)
 
         # Add each page with flow layout (NO fixed width/height to prevent overflow)
-        for i, page_html in enumerate(pages_html, 1):
-            html_parts.append('    <div class="page">')
-            html_parts.append(page_html)
-            html_parts.append('    </div>')
-
-        html_parts.extend([
-            '</body>',
-            '</html>'
-        ])
-
-        return '\n'.join(html_parts)
+        # Page bodies are already line-terminated
+        for page_html in pages_html:
+            out.write('    <div class="page">\n')
+            out.write(page_html)
+            out.write('    </div>\n')
+
+        self._write_multi_page_footer(out)
+        return out.getvalue()
+
+    def _write_multi_page_header(self, out: TextIO):
+        """Write the document head and opening body tag of the multi-page document"""
+        out.write('<!DOCTYPE html>\n'
+                  '<html lang="en">\n'
+                  '<head>\n'
+                  '    <meta charset="UTF-8">\n'
+                  '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+                  '    <title>Reconstructed Document</title>\n')
+        out.write(self._generate_flow_css())  # Use flow CSS instead of absolute positioning CSS
+        out.write('\n    <style>\n'
+                  '        .page {\n'
+                  '            margin-bottom: 40px;\n'
+                  '            page-break-after: always;\n'
+                  '        }\n'
+                  '        @media print {\n'
+                  '            body { background-color: white; padding: 0; }\n'
+                  '            .page { margin: 0; box-shadow: none; page-break-after: always; }\n'
+                  '        }\n'
+                  '    </style>\n'
+                  '</head>\n'
+                  '<body>\n')
+
+    def _write_multi_page_footer(self, out: TextIO):
+        """Close the multi-page document"""
+        out.write('</body>\n'
+                  '</html>')
+
+
+_worker_generator = None
+
+
+def _render_one_page(task: tuple) -> str:
+    """Render one page body from a (content, page_info, html_output_path) tuple (process pool worker)"""
+    global _worker_generator
+    if _worker_generator is None:
+        # One generator per worker so image caches persist across its pages
+        _worker_generator = HTMLPageGenerator()
+    content, page_info, html_output_path = task
+    return _worker_generator._build_page_body(content, page_info, html_output_path)
 
 
 def main():
@@ -935,6 +1074,7 @@ def main():
     parser.add_argument('--page-height', type=float, default=792, help='Page height in points')
 
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
     # Load content
     with open(args.content_json, 'r', encoding='utf-8') as f:
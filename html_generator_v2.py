@@ -3,11 +3,310 @@ HTML Page Generator Module V2
 Generates readable HTML pages from extracted content with proper reading flow
 """
 
+import hashlib
+import html
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict
+from typing import BinaryIO, Dict, List, TextIO, Tuple
 import base64
 
+# Buffer size for streaming multi-page documents to disk
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Multi-page documents shorter than this render in-process (pool startup would dominate)
+_PARALLEL_MIN_PAGES = 4
+
+# Shared read-only default for missing nested dicts (never mutate it)
+_EMPTY: Dict = {}
+
+# Sort key for (sort_key, ...) tuples built before rendering
+_SORT_KEY = itemgetter(0)
+
+# Static document fragments; only the title and the stylesheet vary
+_DOCTYPE_HEAD_PREFIX = ('<!DOCTYPE html>\n'
+                        '<html lang="en">\n'
+                        '<head>\n'
+                        '    <meta charset="UTF-8">\n'
+                        '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+                        '    <title>')
+_TITLE_CLOSE = '</title>\n'
+_BODY_OPEN = '\n</head>\n<body>\n'
+_PAGE_OPEN = '    <div class="page">\n'
+_PAGE_CLOSE = '    </div>\n'
+_HTML_CLOSE = '</body>\n</html>'
+_HTML_CLOSE_BYTES = _HTML_CLOSE.encode('utf-8')
+# Table containers, without and with a caption (table HTML is inserted as-is)
+_TABLE_TPL_NO_CAP = ('        <div class="table-container">\n'
+                     '            %s\n'
+                     '        </div>\n')
+_TABLE_TPL_CAP = ('        <div class="table-container">\n'
+                  '            <div class="table-caption">%s</div>\n'
+                  '            %s\n'
+                  '        </div>\n')
+
+# Image placeholder blocks, without and with a caption
+_IMG_TPL_NO_CAP = ('        <div class="image-container">\n'
+                   '            <div class="image-placeholder">\n'
+                   '                <p class="image-description">%s</p>\n'
+                   '            </div>\n'
+                   '        </div>\n')
+_IMG_TPL_WITH_CAP = _IMG_TPL_NO_CAP.replace(
+    '            </div>\n        </div>\n',
+    '            </div>\n            <p class="image-caption">%s</p>\n        </div>\n')
+_MULTIPAGE_EXTRA_CSS = ('\n    <style>\n'
+                        '        .page { margin-bottom: 3em; page-break-after: always; }\n'
+                        '        .page:last-child { margin-bottom: 0; }\n'
+                        '        .page-number { text-align: center; font-size: 0.85em; color: #999; margin-top: 1.5em; padding-top: 1em; border-top: 1px solid #e0e0e0; }\n'
+                        '        @media print { .page { margin: 0; box-shadow: none; page-break-after: always; } }\n'
+                        '    </style>')
+
+
+@lru_cache(maxsize=4096)
+def _escape_text(text: str) -> str:
+    """Escape extracted text for use as element content (headers and captions repeat, so cache)"""
+    return html.escape(text, quote=False)
+
+
+def _tagged(render, elements: List[Dict]):
+    """Yield ((order, y), render, element) for legacy elements in a single pass"""
+    for elem in elements:
+        pos = elem.get('position') or _EMPTY
+        yield (elem.get('order', 999), pos.get('y_start', pos.get('top_percent', 0))), render, elem
+
+
+def _write_table_block(out: TextIO, table_html: str, caption: str):
+    """Write a table container, shared by the content-item and legacy renderers"""
+    if caption:
+        out.write(_TABLE_TPL_CAP % (_escape_text(caption), table_html))
+    else:
+        out.write(_TABLE_TPL_NO_CAP % table_html)
+
+
+def _write_image_placeholder(out: TextIO, description: str, caption: str):
+    """Write an image placeholder block, shared by the content-item and legacy renderers"""
+    if caption:
+        out.write(_IMG_TPL_WITH_CAP % (_escape_text(description), _escape_text(caption)))
+    else:
+        out.write(_IMG_TPL_NO_CAP % _escape_text(description))
+
+
+def _list_items(content: str) -> List[str]:
+    """Split list content into stripped, non-empty lines (one strip per line)"""
+    # split('\n') rather than splitlines(): form feeds and other separators stay inside a line
+    return [stripped for line in content.split('\n') if (stripped := line.strip())]
+
+
+@lru_cache(maxsize=32)
+def _fmt_wrappers_impl(bold: bool, italic: bool, underline: bool) -> Tuple[str, str]:
+    """Opening and closing tags for a formatting combination (bold innermost, underline outermost)"""
+    prefix, suffix = '', ''
+    if bold:
+        prefix, suffix = '<strong>', '</strong>'
+    if italic:
+        prefix, suffix = '<em>' + prefix, suffix + '</em>'
+    if underline:
+        prefix, suffix = '<u>' + prefix, suffix + '</u>'
+    return prefix, suffix
+
+
+# Page stylesheet; __COLUMNS__ is replaced with the multi-column rules (or nothing)
+_CSS_TEMPLATE = '''    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Georgia', 'Times New Roman', Times, serif;
+            background-color: #f5f5f5;
+            padding: 20px;
+            line-height: 1.8;
+            color: #333;
+        }
+
+        .page {
+            background-color: white;
+            max-width: 8.5in;
+            margin: 0 auto;
+            padding: 1in;
+            box-shadow: 0 2px 15px rgba(0,0,0,0.1);
+            __COLUMNS__
+        }
+
+        h1, h2, h3, h4, h5, h6 {
+            font-weight: bold;
+            margin-top: 1.5em;
+            margin-bottom: 0.75em;
+            color: #000;
+            line-height: 1.3;
+            text-align: left;
+        }
+
+        h1 { font-size: 2.2em; }
+        h2 { font-size: 1.8em; }
+        h3 { font-size: 1.5em; }
+        h4 { font-size: 1.3em; }
+        h5 { font-size: 1.1em; }
+        h6 { font-size: 1em; }
+
+        p {
+            margin-bottom: 1.2em;
+        }
+
+        p.justified {
+            text-align: justify;
+        }
+
+        ul, ol {
+            margin-left: 2.5em;
+            margin-bottom: 1.2em;
+        }
+
+        li {
+            margin-bottom: 0.5em;
+        }
+
+        .table-container {
+            margin: 2em 0;
+            overflow-x: auto;
+            break-inside: avoid;
+        }
+
+        .table-caption {
+            font-weight: 600;
+            text-align: center;
+            margin-bottom: 0.75em;
+            font-size: 0.95em;
+            color: #444;
+        }
+
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 0 auto;
+            font-size: 0.9em;
+            background-color: white;
+        }
+
+        th, td {
+            border: 1px solid #333;
+            padding: 10px 14px;
+            text-align: left;
+            vertical-align: top;
+        }
+
+        th {
+            background-color: #f8f8f8;
+            font-weight: bold;
+            color: #000;
+        }
+
+        td:empty::after {
+            content: "\\00a0";
+        }
+
+        .image-container {
+            margin: 2em 0;
+            text-align: center;
+            break-inside: avoid;
+        }
+
+        .image-placeholder {
+            background: linear-gradient(135deg, #f0f0f0 0%, #e0e0e0 100%);
+            border: 2px dashed #999;
+            min-height: 250px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin-bottom: 0.75em;
+            border-radius: 4px;
+        }
+
+        .image-description {
+            color: #666;
+            font-style: italic;
+            padding: 30px;
+            font-size: 0.95em;
+        }
+
+        .image-caption {
+            font-style: italic;
+            font-size: 0.9em;
+            color: #444;
+            margin-top: 0.5em;
+            text-align: center;
+        }
+
+        .caption {
+            font-style: italic;
+            font-size: 0.9em;
+            color: #666;
+            text-align: center;
+            margin: 1em 0;
+        }
+
+        strong {
+            font-weight: 700;
+        }
+
+        em {
+            font-style: italic;
+        }
+
+        u {
+            text-decoration: underline;
+        }
+
+        @media print {
+            body {
+                background-color: white;
+                padding: 0;
+            }
+
+            .page {
+                box-shadow: none;
+                padding: 0.5in;
+                max-width: none;
+            }
+
+            .image-placeholder {
+                border: 1px solid #ccc;
+                background: #f5f5f5;
+            }
+        }
+
+        @media screen and (max-width: 768px) {
+            .page {
+                padding: 0.5in;
+                column-count: 1 !important;
+            }
+        }
+    </style>'''
+
+
+def _fmt_wrappers(formatting: Dict) -> Tuple[str, str]:
+    """Opening and closing tags for a formatting dict; empty strings when there is nothing to apply"""
+    if not formatting:
+        return '', ''
+    return _fmt_wrappers_impl(bool(formatting.get('bold')), bool(formatting.get('italic')),
+                              bool(formatting.get('underline')))
+
+
+@lru_cache(maxsize=8)
+def _generate_css_cached(columns: int) -> str:
+    """Build the page stylesheet; it depends only on the column count"""
+    if columns > 1:
+        columns_css = f'column-count: {columns};\n            column-gap: 0.5in;'
+    else:
+        columns_css = '\n            '
+    return _CSS_TEMPLATE.replace('__COLUMNS__', columns_css)
+
 
 class HTMLPageGenerator:
     def __init__(self, page_width: float = 612, page_height: float = 792):
@@ -20,6 +319,7 @@ class HTMLPageGenerator:
         """
         self.page_width = page_width
         self.page_height = page_height
+        self._dirs_created = set()  # Output directories already created by this generator
 
     def generate_page_html(self, content: Dict, page_info: Dict, output_path: str = None) -> str:
         """
@@ -41,236 +341,191 @@ class HTMLPageGenerator:
             self.page_width = page_info.get('original_width', self.page_width)
             self.page_height = page_info.get('original_height', self.page_height)
 
-        # Generate HTML content
-        html_content = self._build_html(content, page_info)
+        # Generate HTML content into a single buffer
+        buf = io.StringIO()
+        self._build_html(content, page_info, buf)
 
         # Determine output path
         if output_path is None:
-            output_dir = Path("output/html_pages")
-            output_dir.mkdir(exist_ok=True, parents=True)
-            output_path = output_dir / f"page_{page_num}.html"
+            output_path = Path("output/html_pages") / f"page_{page_num}.html"
         else:
             output_path = Path(output_path)
-            output_path.parent.mkdir(exist_ok=True, parents=True)
+        self._ensure_dir(output_path.parent)
 
-        # Write HTML to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Write HTML to file, encoded in one pass
+        with open(output_path, 'wb') as f:
+            f.write(buf.getvalue().encode('utf-8'))
 
         print(f"  ✓ Readable HTML saved to: {output_path}")
         return str(output_path)
 
-    def _build_html(self, content: Dict, page_info: Dict) -> str:
-        """Build complete HTML document with proper reading flow"""
+    def _ensure_dir(self, directory: Path):
+        """Create an output directory once per generator instead of on every write"""
+        key = str(directory)
+        if key not in self._dirs_created:
+            directory.mkdir(exist_ok=True, parents=True)
+            self._dirs_created.add(key)
+
+    def _build_html(self, content: Dict, page_info: Dict, out: TextIO):
+        """Write complete HTML document with proper reading flow into out"""
         page_num = content.get('page_num', 1)
-        layout = content.get('layout', {})
-
-        html_parts = [
-            '<!DOCTYPE html>',
-            '<html lang="en">',
-            '<head>',
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            f'    <title>Page {page_num}</title>',
-            self._generate_css(layout),
-            '</head>',
-            '<body>',
-            f'    <div class="page">',
-        ]
+        layout = content.get('layout', _EMPTY)
+
+        out.write(_DOCTYPE_HEAD_PREFIX)
+        out.write('Page ')
+        out.write(str(page_num))
+        out.write(_TITLE_CLOSE)
+        out.write(self._generate_css(layout))
+        out.write(_BODY_OPEN)
+        out.write(_PAGE_OPEN)
 
+        self._render_page_body(content, page_info, out)
+
+        # Close HTML
+        out.write(_PAGE_CLOSE)
+        out.write(_HTML_CLOSE)
+
+    def _render_page_body(self, content: Dict, page_info: Dict, out: TextIO):
+        """Write the body of one page, one line-terminated element at a time"""
         # Check if we have new format with content_items
         if 'content_items' in content and content['content_items']:
             # New format: render in reading order
-            html_parts.append(self._render_content_items_flow(content['content_items'], page_info))
+            self._render_content_items_flow(content['content_items'], page_info, out)
         else:
             # Legacy format: try to extract reading order
-            html_parts.append(self._render_legacy_improved(content, page_info))
+            self._render_legacy_improved(content, page_info, out)
 
-        # Close HTML
-        html_parts.extend([
-            '    </div>',
-            '</body>',
-            '</html>'
-        ])
-
-        return '\n'.join(html_parts)
-
-    def _render_content_items_flow(self, content_items: List[Dict], page_info: Dict) -> str:
+    def _render_content_items_flow(self, content_items: List[Dict], page_info: Dict, out: TextIO):
         """Render content items in natural reading flow"""
-        html_parts = []
-
-        # Sort by order and position
-        sorted_items = sorted(
-            content_items,
-            key=lambda x: (x.get('order', 999), x.get('position', {}).get('y_start', 0))
-        )
-
+        # Sort by order and position (keys computed once, compared as plain tuples)
+        decorated = [((item.get('order', 999), (item.get('position') or _EMPTY).get('y_start', 0)), item)
+                     for item in content_items]
+        decorated.sort(key=_SORT_KEY)
+        sorted_items = [item for _, item in decorated]
+
+        # Unknown types are treated as paragraphs
+        dispatch = self._DISPATCH
+        render_paragraph = HTMLPageGenerator._render_paragraph
         for item in sorted_items:
-            item_type = item.get('type', 'paragraph')
-
-            if item_type == 'header':
-                html_parts.append(self._render_header(item))
-            elif item_type == 'paragraph':
-                html_parts.append(self._render_paragraph(item))
-            elif item_type == 'table':
-                html_parts.append(self._render_table(item))
-            elif item_type == 'image':
-                html_parts.append(self._render_image(item))
-            elif item_type == 'list':
-                html_parts.append(self._render_list(item))
-            elif item_type == 'caption':
-                html_parts.append(self._render_caption(item))
-            else:
-                # Unknown type, treat as paragraph
-                html_parts.append(self._render_paragraph(item))
-
-        return '\n'.join(html_parts)
-
-    def _render_header(self, item: Dict) -> str:
+            dispatch.get(item.get('type', 'paragraph'), render_paragraph)(self, item, out)
+
+    def _render_header(self, item: Dict, out: TextIO):
         """Render header element"""
         content = item.get('content', '')
-        metadata = item.get('metadata', {})
-        formatting = item.get('formatting', {})
+        metadata = item.get('metadata', _EMPTY)
+        formatting = item.get('formatting', _EMPTY)
 
         level = metadata.get('level', 1)
-        level = max(1, min(6, level))  # Clamp to 1-6
+        level = str(max(1, min(6, level)))  # Clamp to 1-6
 
-        formatted_content = self._apply_formatting(content, formatting)
+        formatted_content = self._apply_formatting(content, formatting) if formatting else _escape_text(content)
         alignment = formatting.get('alignment', 'left')
 
-        return f'        <h{level} style="text-align: {alignment};">{formatted_content}</h{level}>'
-
-    def _render_paragraph(self, item: Dict) -> str:
+        out.write('        <h')
+        out.write(level)
+        # Left is the stylesheet default, so only other alignments need an inline style
+        if alignment == 'left':
+            out.write('>')
+        else:
+            out.write(' style="text-align: ')
+            out.write(alignment)
+            out.write(';">')
+        out.write(formatted_content)
+        out.write('</h')
+        out.write(level)
+        out.write('>\n')
+
+    def _render_paragraph(self, item: Dict, out: TextIO):
         """Render paragraph element"""
         content = item.get('content', '')
-        formatting = item.get('formatting', {})
+        formatting = item.get('formatting', _EMPTY)
 
-        formatted_content = self._apply_formatting(content, formatting)
+        formatted_content = self._apply_formatting(content, formatting) if formatting else _escape_text(content)
         alignment = formatting.get('alignment', 'justify')
 
-        return f'        <p style="text-align: {alignment};">{formatted_content}</p>'
+        # Justify comes from the p.justified rule, so only other alignments need an inline style
+        if alignment == 'justify':
+            out.write('        <p class="justified">')
+        else:
+            out.write('        <p style="text-align: ')
+            out.write(alignment)
+            out.write(';">')
+        out.write(formatted_content)
+        out.write('</p>\n')
 
-    def _render_table(self, item: Dict) -> str:
+    def _render_table(self, item: Dict, out: TextIO):
         """Render table element"""
-        table_html = item.get('content', '')
-        metadata = item.get('metadata', {})
-        caption = metadata.get('caption', '')
-
-        parts = ['        <div class="table-container">']
+        _write_table_block(out, item.get('content', ''), item.get('metadata', _EMPTY).get('caption', ''))
 
-        if caption:
-            parts.append(f'            <div class="table-caption">{caption}</div>')
-
-        parts.append(f'            {table_html}')
-        parts.append('        </div>')
-
-        return '\n'.join(parts)
-
-    def _render_image(self, item: Dict) -> str:
+    def _render_image(self, item: Dict, out: TextIO):
         """Render image placeholder"""
-        metadata = item.get('metadata', {})
-        description = metadata.get('description', 'Image')
-        caption = metadata.get('caption', '')
-
-        parts = [
-            '        <div class="image-container">',
-            '            <div class="image-placeholder">',
-            f'                <p class="image-description">{description}</p>',
-            '            </div>'
-        ]
+        metadata = item.get('metadata', _EMPTY)
+        _write_image_placeholder(out, metadata.get('description', 'Image'), metadata.get('caption', ''))
 
-        if caption:
-            parts.append(f'            <p class="image-caption">{caption}</p>')
-
-        parts.append('        </div>')
-
-        return '\n'.join(parts)
-
-    def _render_list(self, item: Dict) -> str:
+    def _render_list(self, item: Dict, out: TextIO):
         """Render list element"""
         content = item.get('content', '')
-        formatting = item.get('formatting', {})
-        metadata = item.get('metadata', {})
+        formatting = item.get('formatting', _EMPTY)
+        metadata = item.get('metadata', _EMPTY)
 
         # Split into items if content contains newlines
-        items = [line.strip() for line in content.split('\n') if line.strip()]
+        items = _list_items(content)
 
         list_type = metadata.get('list_type', 'unordered')
         tag = 'ul' if list_type == 'unordered' else 'ol'
 
-        parts = [f'        <{tag}>']
+        out.write('        <')
+        out.write(tag)
+        out.write('>\n')
+        # Same formatting for every item: resolve the wrapper tags once
+        prefix, suffix = _fmt_wrappers(formatting)
         for list_item in items:
-            formatted = self._apply_formatting(list_item, formatting)
-            parts.append(f'            <li>{formatted}</li>')
-        parts.append(f'        </{tag}>')
-
-        return '\n'.join(parts)
-
-    def _render_caption(self, item: Dict) -> str:
+            out.write('            <li>')
+            out.write(prefix)
+            out.write(_escape_text(list_item))
+            out.write(suffix)
+            out.write('</li>\n')
+        out.write('        </')
+        out.write(tag)
+        out.write('>\n')
+
+    def _render_caption(self, item: Dict, out: TextIO):
         """Render caption element"""
         content = item.get('content', '')
-        formatting = item.get('formatting', {})
+        formatting = item.get('formatting', _EMPTY)
 
-        formatted_content = self._apply_formatting(content, formatting)
-        return f'        <p class="caption">{formatted_content}</p>'
+        out.write('        <p class="caption">')
+        out.write(self._apply_formatting(content, formatting) if formatting else _escape_text(content))
+        out.write('</p>\n')
 
     def _apply_formatting(self, content: str, formatting: Dict) -> str:
-        """Apply text formatting"""
+        """Escape extracted text and apply text formatting"""
+        content = _escape_text(content)
         if not formatting:
             return content
 
-        if formatting.get('bold'):
-            content = f'<strong>{content}</strong>'
-        if formatting.get('italic'):
-            content = f'<em>{content}</em>'
-        if formatting.get('underline'):
-            content = f'<u>{content}</u>'
-
-        return content
+        prefix, suffix = _fmt_wrappers(formatting)
+        if not prefix:
+            return content
+        return f'{prefix}{content}{suffix}'
 
-    def _render_legacy_improved(self, content: Dict, page_info: Dict) -> str:
+    def _render_legacy_improved(self, content: Dict, page_info: Dict, out: TextIO):
         """Render legacy format with improved ordering"""
-        all_items = []
-
-        # Collect all elements with order/position
-        for text_block in content.get('text_blocks', []):
-            order = text_block.get('order', 999)
-            pos = text_block.get('position', {})
-            y_pos = pos.get('y_start', pos.get('top_percent', 0))
-            all_items.append(('text', text_block, order, y_pos))
-
-        for table in content.get('tables', []):
-            order = table.get('order', 999)
-            pos = table.get('position', {})
-            y_pos = pos.get('y_start', pos.get('top_percent', 0))
-            all_items.append(('table', table, order, y_pos))
-
-        for image in content.get('images', []):
-            order = image.get('order', 999)
-            pos = image.get('position', {})
-            y_pos = pos.get('y_start', pos.get('top_percent', 0))
-            all_items.append(('image', image, order, y_pos))
-
-        # Sort by order, then position
-        all_items.sort(key=lambda x: (x[2], x[3]))
+        # Collect all elements tagged with their renderer, then sort once by order, then position
+        all_items = sorted(chain(_tagged(self._render_text_block, content.get('text_blocks', ())),
+                                 _tagged(self._render_table_legacy, content.get('tables', ())),
+                                 _tagged(self._render_image_legacy, content.get('images', ()))),
+                           key=_SORT_KEY)
 
         # Render in order
-        parts = []
-        for elem_type, elem, _, _ in all_items:
-            if elem_type == 'text':
-                parts.append(self._render_text_block(elem))
-            elif elem_type == 'table':
-                parts.append(self._render_table_legacy(elem))
-            elif elem_type == 'image':
-                parts.append(self._render_image_legacy(elem))
-
-        return '\n'.join(parts)
-
-    def _render_text_block(self, text_block: Dict) -> str:
+        for _, render, elem in all_items:
+            render(elem, out)
+
+    def _render_text_block(self, text_block: Dict, out: TextIO):
         """Render text block (legacy)"""
         block_type = text_block.get('type', 'paragraph')
         content = text_block.get('content', '')
-        formatting = text_block.get('formatting', {})
+        formatting = text_block.get('formatting', _EMPTY)
 
         # Convert list format if needed
         if isinstance(formatting, list):
@@ -280,229 +535,57 @@ class HTMLPageGenerator:
                 'underline': 'underline' in formatting
             }
 
-        formatted = self._apply_formatting(content, formatting)
-
         if block_type == 'header':
-            level = text_block.get('level', 1)
-            return f'        <h{level}>{formatted}</h{level}>'
+            level = str(text_block.get('level', 1))
+            out.write('        <h')
+            out.write(level)
+            out.write('>')
+            out.write(self._apply_formatting(content, formatting) if formatting else _escape_text(content))
+            out.write('</h')
+            out.write(level)
+            out.write('>\n')
         elif block_type == 'list':
-            items = [line.strip() for line in content.split('\n') if line.strip()]
-            html = '        <ul>'
+            items = _list_items(content)
+            out.write('        <ul>\n')
+            prefix, suffix = _fmt_wrappers(formatting)
             for item in items:
-                html += f'\n            <li>{self._apply_formatting(item, formatting)}</li>'
-            html += '\n        </ul>'
-            return html
+                out.write('            <li>')
+                out.write(prefix)
+                out.write(_escape_text(item))
+                out.write(suffix)
+                out.write('</li>\n')
+            out.write('        </ul>\n')
         else:
-            return f'        <p>{formatted}</p>'
+            out.write('        <p>')
+            out.write(self._apply_formatting(content, formatting) if formatting else _escape_text(content))
+            out.write('</p>\n')
 
-    def _render_table_legacy(self, table: Dict) -> str:
+    def _render_table_legacy(self, table: Dict, out: TextIO):
         """Render table (legacy)"""
-        table_html = table.get('html', '')
-        caption = table.get('caption', '')
+        _write_table_block(out, table.get('html', ''), table.get('caption', ''))
 
-        parts = ['        <div class="table-container">']
-        if caption:
-            parts.append(f'            <div class="table-caption">{caption}</div>')
-        parts.append(f'            {table_html}')
-        parts.append('        </div>')
-
-        return '\n'.join(parts)
-
-    def _render_image_legacy(self, image: Dict) -> str:
+    def _render_image_legacy(self, image: Dict, out: TextIO):
         """Render image (legacy)"""
-        description = image.get('description', 'Image')
-        caption = image.get('caption', '')
-
-        parts = [
-            '        <div class="image-container">',
-            '            <div class="image-placeholder">',
-            f'                <p class="image-description">{description}</p>',
-            '            </div>'
-        ]
-
-        if caption:
-            parts.append(f'            <p class="image-caption">{caption}</p>')
-
-        parts.append('        </div>')
-
-        return '\n'.join(parts)
+        _write_image_placeholder(out, image.get('description', 'Image'), image.get('caption', ''))
 
     def _generate_css(self, layout: Dict) -> str:
         """Generate modern, readable CSS"""
-        columns = layout.get('columns', 1)
-
-        return f'''    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Georgia', 'Times New Roman', Times, serif;
-            background-color: #f5f5f5;
-            padding: 20px;
-            line-height: 1.8;
-            color: #333;
-        }}
-
-        .page {{
-            background-color: white;
-            max-width: 8.5in;
-            margin: 0 auto;
-            padding: 1in;
-            box-shadow: 0 2px 15px rgba(0,0,0,0.1);
-            {f'column-count: {columns};' if columns > 1 else ''}
-            {f'column-gap: 0.5in;' if columns > 1 else ''}
-        }}
-
-        h1, h2, h3, h4, h5, h6 {{
-            font-weight: bold;
-            margin-top: 1.5em;
-            margin-bottom: 0.75em;
-            color: #000;
-            line-height: 1.3;
-        }}
-
-        h1 {{ font-size: 2.2em; }}
-        h2 {{ font-size: 1.8em; }}
-        h3 {{ font-size: 1.5em; }}
-        h4 {{ font-size: 1.3em; }}
-        h5 {{ font-size: 1.1em; }}
-        h6 {{ font-size: 1em; }}
-
-        p {{
-            margin-bottom: 1.2em;
-        }}
-
-        ul, ol {{
-            margin-left: 2.5em;
-            margin-bottom: 1.2em;
-        }}
-
-        li {{
-            margin-bottom: 0.5em;
-        }}
-
-        .table-container {{
-            margin: 2em 0;
-            overflow-x: auto;
-            break-inside: avoid;
-        }}
+        return _generate_css_cached(int(layout.get('columns', 1) or 1))
 
-        .table-caption {{
-            font-weight: 600;
-            text-align: center;
-            margin-bottom: 0.75em;
-            font-size: 0.95em;
-            color: #444;
-        }}
-
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 0 auto;
-            font-size: 0.9em;
-            background-color: white;
-        }}
-
-        th, td {{
-            border: 1px solid #333;
-            padding: 10px 14px;
-            text-align: left;
-            vertical-align: top;
-        }}
-
-        th {{
-            background-color: #f8f8f8;
-            font-weight: bold;
-            color: #000;
-        }}
-
-        td:empty::after {{
-            content: "\\00a0";
-        }}
-
-        .image-container {{
-            margin: 2em 0;
-            text-align: center;
-            break-inside: avoid;
-        }}
-
-        .image-placeholder {{
-            background: linear-gradient(135deg, #f0f0f0 0%, #e0e0e0 100%);
-            border: 2px dashed #999;
-            min-height: 250px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin-bottom: 0.75em;
-            border-radius: 4px;
-        }}
-
-        .image-description {{
-            color: #666;
-            font-style: italic;
-            padding: 30px;
-            font-size: 0.95em;
-        }}
-
-        .image-caption {{
-            font-style: italic;
-            font-size: 0.9em;
-            color: #444;
-            margin-top: 0.5em;
-        }}
-
-        .caption {{
-            font-style: italic;
-            font-size: 0.9em;
-            color: #666;
-            text-align: center;
-            margin: 1em 0;
-        }}
-
-        strong {{
-            font-weight: 700;
-        }}
-
-        em {{
-            font-style: italic;
-        }}
-
-        u {{
-            text-decoration: underline;
-        }}
-
-        @media print {{
-            body {{
-                background-color: white;
-                padding: 0;
-            }}
-
-            .page {{
-                box-shadow: none;
-                padding: 0.5in;
-                max-width: none;
-            }}
-
-            .image-placeholder {{
-                border: 1px solid #ccc;
-                background: #f5f5f5;
-            }}
-        }}
+    def generate_multi_page_html(self, pages_content: List[Dict], pages_info: List[Dict],
+                                 output_path: str = None, max_workers: int = None) -> str:
+        """
+        Generate single HTML file with all pages
 
-        @media screen and (max-width: 768px) {{
-            .page {{
-                padding: 0.5in;
-                column-count: 1 !important;
-            }}
-        }}
-    </style>'''
+        Args:
+            pages_content: List of extracted content for each page
+            pages_info: List of page information
+            output_path: Path to save the combined HTML
+            max_workers: Worker processes for page rendering (default: CPU count)
 
-    def generate_multi_page_html(self, pages_content: List[Dict], pages_info: List[Dict],
-                                 output_path: str = None) -> str:
-        """Generate single HTML file with all pages"""
+        Returns:
+            Path to the generated HTML file
+        """
         print(f"\nGenerating multi-page HTML document...")
 
         if output_path is None:
@@ -510,86 +593,129 @@ class HTMLPageGenerator:
         else:
             output_path = Path(output_path)
 
-        output_path.parent.mkdir(exist_ok=True, parents=True)
+        self._ensure_dir(output_path.parent)
 
-        # Generate pages
-        pages_html = []
-        for content, info in zip(pages_content, pages_info):
-            if info:
-                self.page_width = info.get('original_width', self.page_width)
-                self.page_height = info.get('original_height', self.page_height)
-
-            if 'content_items' in content and content['content_items']:
-                page_body = self._render_content_items_flow(content['content_items'], info)
-            else:
-                page_body = self._render_legacy_improved(content, info)
-
-            pages_html.append(page_body)
-
-        # Build complete HTML
-        layout = pages_content[0].get('layout', {}) if pages_content else {}
-        html_content = self._build_multi_page_html(pages_html, layout)
-
-        # Save
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream each page to the file as it is rendered; only one page is in flight at a time
+        layout = pages_content[0].get('layout', _EMPTY) if pages_content else _EMPTY
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            self._build_multi_page_html(pages_content, pages_info, layout, f, max_workers)
 
         print(f"  ✓ Multi-page HTML saved to: {output_path}")
         return str(output_path)
 
-    def _build_multi_page_html(self, pages_html: List[str], layout: Dict) -> str:
-        """Build complete multi-page document"""
-        html_parts = [
-            '<!DOCTYPE html>',
-            '<html lang="en">',
-            '<head>',
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            '    <title>Document</title>',
-            self._generate_css(layout),
-            '    <style>',
-            '        .page { margin-bottom: 3em; page-break-after: always; }',
-            '        .page:last-child { margin-bottom: 0; }',
-            '        .page-number { text-align: center; font-size: 0.85em; color: #999; margin-top: 1.5em; padding-top: 1em; border-top: 1px solid #e0e0e0; }',
-            '        @media print { .page { margin: 0; box-shadow: none; page-break-after: always; } }',
-            '    </style>',
-            '</head>',
-            '<body>',
-        ]
-
-        for i, page_html in enumerate(pages_html, 1):
-            html_parts.append('    <div class="page">')
-            html_parts.append(page_html)
-            html_parts.append(f'        <div class="page-number">— {i} —</div>')
-            html_parts.append('    </div>')
-
-        html_parts.extend(['</body>', '</html>'])
-
-        return '\n'.join(html_parts)
+    def _build_multi_page_html(self, pages_content: List[Dict], pages_info: List[Dict],
+                               layout: Dict, out: BinaryIO, max_workers: int = None):
+        """Write complete multi-page document into a binary out, encoding one page at a time"""
+        out.write(''.join((_DOCTYPE_HEAD_PREFIX, 'Document', _TITLE_CLOSE, self._generate_css(layout),
+                           _MULTIPAGE_EXTRA_CSS, _BODY_OPEN)).encode('utf-8'))
+
+        for info in pages_info[:len(pages_content)]:
+            if info:
+                self.page_width = info.get('original_width', self.page_width)
+                self.page_height = info.get('original_height', self.page_height)
+
+        if len(pages_content) < _PARALLEL_MIN_PAGES or max_workers == 1:
+            for i, (content, info) in enumerate(zip(pages_content, pages_info), 1):
+                out.write(self._render_page(content, info, i).encode('utf-8'))
+        else:
+            # Pages are independent; render them in worker processes and write in order
+            tasks = [(content, info, i) for i, (content, info) in enumerate(zip(pages_content, pages_info), 1)]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for page_bytes in executor.map(_render_one_page, tasks, chunksize=4):
+                    out.write(page_bytes)
+
+        out.write(_HTML_CLOSE_BYTES)
+
+    def _render_page(self, content: Dict, page_info: Dict, page_number: int) -> str:
+        """Render one numbered page of the multi-page document"""
+        page = io.StringIO()
+        page.write(_PAGE_OPEN)
+        self._render_page_body(content, page_info, page)
+        page.write('        <div class="page-number">— ')
+        page.write(str(page_number))
+        page.write(' —</div>\n')
+        page.write(_PAGE_CLOSE)
+        return page.getvalue()
+
+    # Renderer for each content item type (unbound functions, called with self)
+    _DISPATCH = {
+        'header': _render_header,
+        'paragraph': _render_paragraph,
+        'table': _render_table,
+        'image': _render_image,
+        'list': _render_list,
+        'caption': _render_caption,
+    }
+
+
+_worker_generator = None
+
+
+def _render_one_page(task: tuple) -> bytes:
+    """Render one numbered page from a (content, page_info, page_number) tuple (process pool worker)"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = HTMLPageGenerator()
+    content, page_info, page_number = task
+    return _worker_generator._render_page(content, page_info, page_number).encode('utf-8')
 
 
 def main():
     """Example usage"""
     import argparse
-    import json
+
+    # orjson parses large extraction files much faster; fall back to the standard library
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
 
     parser = argparse.ArgumentParser(description='Generate readable HTML from extracted content')
     parser.add_argument('content_json', help='Path to extracted content JSON file')
     parser.add_argument('--output', help='Output HTML file path')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Regenerate even if the output is up to date with the input')
 
     args = parser.parse_args()
 
     # Load content
-    with open(args.content_json, 'r', encoding='utf-8') as f:
-        content = json.load(f)
+    raw = Path(args.content_json).read_bytes()
+    content = loads(raw)
+
+    # Same default location generate_page_html uses
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        output_path = Path("output/html_pages") / f"page_{content.get('page_num', 1)}.html"
+
+    # Skip rendering when the output was produced from identical input by this same generator
+    digest = _input_digest(raw)
+    hash_path = output_path.with_name(output_path.name + '.hash')
+    if not args.no_cache and output_path.exists() and hash_path.exists():
+        if hash_path.read_text(encoding='utf-8').strip() == digest:
+            print(f"\n✓ Readable HTML up to date: {output_path}")
+            return
 
     # Generate HTML
     generator = HTMLPageGenerator()
     page_info = {}
-    html_path = generator.generate_page_html(content, page_info, args.output)
+    html_path = generator.generate_page_html(content, page_info, str(output_path))
+
+    # Record the input digest next to the output (written atomically)
+    tmp_path = hash_path.with_name(hash_path.name + '.tmp')
+    tmp_path.write_text(digest, encoding='utf-8')
+    os.replace(tmp_path, hash_path)
 
     print(f"\n✓ Readable HTML generated: {html_path}")
 
 
+def _input_digest(raw: bytes) -> str:
+    """Hash of the input JSON plus this module's source, so generator changes invalidate old output"""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(raw)
+    return digest.hexdigest()
+
+
 if __name__ == "__main__":
     main()
@@ -3,11 +3,101 @@ HTML to PDF Converter Module
 Converts HTML pages back to PDF format with high-quality rendering
 """
 
+import hashlib
+import io
+import logging
 import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
+from urllib.parse import unquote
 import subprocess
 
+logger = logging.getLogger(__name__)
+
+# Buffer size for writing merged PDFs; the default 8 KiB means one syscall per few objects
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Below this many pages a process pool costs more to start than it saves; each worker also
+# gets at least this many pages so its browser start-up is shared across them
+_PARALLEL_MIN_PAGES = 4
+
+# Upper bound on worker processes, each of which runs its own Chromium
+_MAX_PARALLEL_WORKERS = 4
+
+# Rendered PDFs are cached here by content hash; set HTML2PDF_CACHE to "" to disable
+_DEFAULT_CACHE_DIR = "~/.cache/doc_extractor/html2pdf"
+
+# Cache limits, enforced whenever a render is stored: entries unused for longer than the
+# maximum age are dropped, then the least recently used ones until the total fits the size cap
+_CACHE_MAX_BYTES = 512 << 20
+_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Local files referenced from HTML (images, stylesheets); data URIs, URLs and anchors are skipped
+_ASSET_REF = re.compile(rb'(?:src|href)\s*=\s*["\'](?!data:|[a-zA-Z][a-zA-Z0-9+.-]*://|#)([^"\']+)["\']')
+
+
+@lru_cache(maxsize=64)
+def _to_pixels(dim: str) -> int:
+    """Parse a CSS dimension string to pixels (96 DPI); every page of a batch repeats the same sizes"""
+    if dim.endswith('in'):
+        return int(float(dim[:-2]) * 96)
+    elif dim.endswith('px'):
+        return int(float(dim[:-2]))
+    elif dim.endswith('pt'):
+        return int(float(dim[:-2]) * 96 / 72)
+    elif dim.endswith('mm'):
+        return int(float(dim[:-2]) * 96 / 25.4)
+    elif dim.endswith('cm'):
+        return int(float(dim[:-2]) * 96 / 2.54)
+    else:
+        return int(float(dim))
+
+
+def _clone_or_copy(src: Path, dst: Path):
+    """
+    Copy a file inside the kernel, as a copy-on-write clone where the filesystem supports it
+
+    copy_file_range reflinks on btrfs/XFS and avoids user-space buffers elsewhere; a hard
+    link is not used because rewriting the output in place would corrupt the cached copy.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            # e.g. EXDEV across filesystems on older kernels; fall back to a regular copy
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _pool_size(page_count: int, max_workers: Optional[int]) -> int:
+    """Worker processes for converting page_count pages (1 means convert in-process)"""
+    workers = min(max_workers or os.cpu_count() or 1, _MAX_PARALLEL_WORKERS)
+    return max(1, min(workers, page_count // _PARALLEL_MIN_PAGES))
+
+
+def _new_pdf_writer():
+    """Create a PdfWriter from pypdf, the maintained successor of PyPDF2, falling back to PyPDF2"""
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        try:
+            from PyPDF2 import PdfWriter
+        except ImportError:
+            raise ImportError("PyPDF2 not installed. Install with: pip install PyPDF2 (or pypdf)")
+    return PdfWriter()
+
 
 class HTMLtoPDFConverter:
     def __init__(self, method: str = "skip"):
@@ -18,6 +108,14 @@ class HTMLtoPDFConverter:
             method: Conversion method - "skip" (HTML only), "weasyprint", "playwright", or "pdfkit"
         """
         self.method = method
+        # Playwright driver and browser, launched on first use and shared across pages
+        self._pw = None
+        self._browser = None
+        # Parsed WeasyPrint page stylesheets keyed by (page_width, page_height), plus a shared font configuration
+        self._css_cache = {}
+        self._font_config = None
+        cache_dir = os.environ.get("HTML2PDF_CACHE", _DEFAULT_CACHE_DIR)
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         if method != "skip":
             self._verify_dependencies()
 
@@ -27,17 +125,17 @@ class HTMLtoPDFConverter:
             try:
                 import weasyprint
                 self.converter = weasyprint
-                print(f"Using WeasyPrint for HTML to PDF conversion")
+                logger.info("Using WeasyPrint for HTML to PDF conversion")
             except ImportError as e:
-                print(f"WeasyPrint error: {e}")
-                print("Falling back to 'skip' mode - will output HTML only")
+                logger.warning("WeasyPrint error: %s", e)
+                logger.warning("Falling back to 'skip' mode - will output HTML only")
                 self.method = "skip"
 
         elif self.method == "playwright":
             try:
                 from playwright.sync_api import sync_playwright
                 self.playwright = sync_playwright
-                print(f"Using Playwright for HTML to PDF conversion")
+                logger.info("Using Playwright for HTML to PDF conversion")
             except ImportError:
                 raise ImportError(
                     "Playwright not installed. Install with: pip install playwright && playwright install"
@@ -47,7 +145,7 @@ class HTMLtoPDFConverter:
             try:
                 import pdfkit
                 self.converter = pdfkit
-                print(f"Using pdfkit for HTML to PDF conversion")
+                logger.info("Using pdfkit for HTML to PDF conversion")
             except ImportError:
                 raise ImportError(
                     "pdfkit not installed. Install with: pip install pdfkit"
@@ -55,6 +153,36 @@ class HTMLtoPDFConverter:
         else:
             raise ValueError(f"Unknown conversion method: {self.method}")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Shut down the shared Playwright browser, if one was launched"""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+    def _ensure_browser(self):
+        """Launch Chromium once and reuse it for every subsequent page"""
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch()
+        return self._browser
+
     def convert_html_to_pdf(self, html_path: str, pdf_path: str = None,
                            page_width: str = "8.5in", page_height: str = "11in") -> str:
         """
@@ -81,68 +209,222 @@ class HTMLtoPDFConverter:
 
         pdf_path.parent.mkdir(exist_ok=True, parents=True)
 
-        print(f"\nConverting HTML to PDF: {html_path.name}")
+        logger.info("Converting HTML to PDF: %s", html_path.name)
 
         if self.method == "skip":
-            print(f"  ⊘ PDF conversion skipped - HTML output only")
-            print(f"  ℹ  HTML file available at: {html_path}")
+            logger.info("  ⊘ PDF conversion skipped - HTML output only")
+            logger.info("  ℹ  HTML file available at: %s", html_path)
             return str(html_path)  # Return HTML path instead
-        elif self.method == "weasyprint":
-            self._convert_with_weasyprint(html_path, pdf_path, page_width, page_height)
+
+        # A browser launched just for this document is shut down again; one already running
+        # belongs to a batch that closes it itself
+        owns_browser = self._browser is None
+        try:
+            cached_pdf = self._cached_pdf(html_path, page_width, page_height)
+            if self._cache_hit(cached_pdf):
+                logger.debug("  ✓ PDF unchanged, reusing cached render")
+                _clone_or_copy(cached_pdf, pdf_path)
+            else:
+                pdf_path.write_bytes(self._render_pdf(html_path, page_width, page_height, cached_pdf))
+        finally:
+            if owns_browser:
+                self.close()
+
+        logger.info("  ✓ PDF saved to: %s", pdf_path)
+        return str(pdf_path)
+
+    def convert_html_to_pdf_bytes(self, html_path: str, page_width: str = "8.5in",
+                                  page_height: str = "11in") -> bytes:
+        """
+        Convert a single HTML file to an in-memory PDF
+
+        Args:
+            html_path: Path to input HTML file
+            page_width: Page width (default: "8.5in" for US Letter)
+            page_height: Page height (default: "11in" for US Letter)
+
+        Returns:
+            The PDF document as bytes
+        """
+        if not os.path.exists(html_path):
+            raise FileNotFoundError(f"HTML file not found: {html_path}")
+        if self.method == "skip":
+            raise ValueError("PDF conversion is disabled in 'skip' mode")
+
+        html_path = Path(html_path)
+
+        logger.debug("Converting HTML to PDF: %s", html_path.name)
+
+        cached_pdf = self._cached_pdf(html_path, page_width, page_height)
+        if self._cache_hit(cached_pdf):
+            logger.debug("  ✓ PDF unchanged, reusing cached render")
+            return cached_pdf.read_bytes()
+
+        return self._render_pdf(html_path, page_width, page_height, cached_pdf)
+
+    def _cached_pdf(self, html_path: Path, page_width: str, page_height: str) -> Optional[Path]:
+        """Cache location for this input (identical HTML, assets, page size and method render the same PDF)"""
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{self._cache_key(html_path, page_width, page_height)}.pdf"
+
+    def _cache_hit(self, cached_pdf: Optional[Path]) -> bool:
+        """Whether a cached render exists; a hit refreshes its mtime so pruning keeps it"""
+        if cached_pdf is None:
+            return False
+        try:
+            os.utime(cached_pdf)
+        except OSError:
+            # Missing, or pruned by another process since the key was computed
+            return False
+        return True
+
+    def _render_pdf(self, html_path: Path, page_width: str, page_height: str,
+                    cached_pdf: Optional[Path]) -> bytes:
+        """Render with the configured method, saving the result to the cache when enabled"""
+        if self.method == "weasyprint":
+            pdf_bytes = self._convert_with_weasyprint(html_path, page_width, page_height)
         elif self.method == "playwright":
-            self._convert_with_playwright(html_path, pdf_path, page_width, page_height)
+            pdf_bytes = self._convert_with_playwright(html_path, page_width, page_height)
         elif self.method == "pdfkit":
-            self._convert_with_pdfkit(html_path, pdf_path, page_width, page_height)
+            pdf_bytes = self._convert_with_pdfkit(html_path, page_width, page_height)
 
-        print(f"  ✓ PDF saved to: {pdf_path}")
-        return str(pdf_path)
+        if cached_pdf is not None:
+            self._store_in_cache(pdf_bytes, cached_pdf)
+
+        return pdf_bytes
 
-    def _convert_with_weasyprint(self, html_path: Path, pdf_path: Path,
-                                 page_width: str, page_height: str):
+    def _cache_key(self, html_path: Path, page_width: str, page_height: str) -> str:
+        """Hash of everything that affects the rendered PDF"""
+        raw = html_path.read_bytes()
+        digest = hashlib.sha256(raw)
+        digest.update(f"|{page_width}x{page_height}|{self.method}".encode())
+
+        # Referenced local files change the rendering without changing the HTML
+        for ref in sorted(set(_ASSET_REF.findall(raw))):
+            asset = html_path.parent / unquote(ref.decode('utf-8', 'replace')).split('?', 1)[0]
+            try:
+                stat = asset.stat()
+            except OSError:
+                continue
+            digest.update(f"|{ref!r}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+        return digest.hexdigest()
+
+    def _store_in_cache(self, pdf_bytes: bytes, cached_pdf: Path):
+        """Save a fresh render into the cache; a failed store only costs a re-render later"""
+        try:
+            cached_pdf.parent.mkdir(exist_ok=True, parents=True)
+            # Write under a temporary name so concurrent workers never see a partial file
+            tmp_path = cached_pdf.with_name(f"{cached_pdf.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(pdf_bytes)
+            os.replace(tmp_path, cached_pdf)
+        except OSError as e:
+            logger.warning("  ⚠ Could not cache PDF: %s", e)
+            return
+        self._prune_cache()
+
+    def _prune_cache(self):
+        """Drop cached renders past _CACHE_MAX_AGE, then the least recently used past _CACHE_MAX_BYTES"""
+        entries = []
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+
+        now = time.time()
+        total = 0
+        # Newest first, so the renders kept are the most recently stored or reused ones
+        for mtime, size, path in sorted(entries, reverse=True):
+            if now - mtime > _CACHE_MAX_AGE or total + size > _CACHE_MAX_BYTES:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            else:
+                total += size
+
+    def _convert_with_weasyprint(self, html_path: Path, page_width: str, page_height: str) -> bytes:
         """Convert using WeasyPrint"""
-        from weasyprint import HTML, CSS
-
-        # Create custom CSS for page size
-        css_string = f"""
-        @page {{
-            size: {page_width} {page_height};
-            margin: 0;
-        }}
-        """
+        from weasyprint import HTML
 
         html = HTML(filename=str(html_path))
-        html.write_pdf(
-            str(pdf_path),
-            stylesheets=[CSS(string=css_string)]
+        return html.write_pdf(
+            stylesheets=[self._weasyprint_css(page_width, page_height)],
+            font_config=self._font_config
         )
 
-    def _convert_with_playwright(self, html_path: Path, pdf_path: Path,
-                                 page_width: str, page_height: str):
+    def _convert_many_with_weasyprint(self, html_paths: List[str], pdf_path: Path,
+                                      page_width: str, page_height: str):
+        """Render several HTML files into one PDF with WeasyPrint, without intermediate files"""
+        from weasyprint import HTML
+
+        stylesheets = [self._weasyprint_css(page_width, page_height)]
+        documents = [HTML(filename=str(html_path)).render(stylesheets=stylesheets,
+                                                          font_config=self._font_config)
+                     for html_path in html_paths]
+        all_pages = [page for document in documents for page in document.pages]
+        documents[0].copy(all_pages).write_pdf(str(pdf_path))
+
+    def _weasyprint_css(self, page_width: str, page_height: str):
+        """Parsed @page stylesheet for a page size, built once per size and reused for every page"""
+        from weasyprint import CSS
+
+        if self._font_config is None:
+            from weasyprint.text.fonts import FontConfiguration
+            self._font_config = FontConfiguration()
+
+        key = (page_width, page_height)
+        css = self._css_cache.get(key)
+        if css is None:
+            css_string = f"""
+            @page {{
+                size: {page_width} {page_height};
+                margin: 0;
+            }}
+            """
+            css = self._css_cache[key] = CSS(string=css_string, font_config=self._font_config)
+        return css
+
+    def _convert_with_playwright(self, html_path: Path, page_width: str, page_height: str) -> bytes:
         """Convert using Playwright (headless browser)"""
-        from playwright.sync_api import sync_playwright
-
         # Convert dimensions to pixels (assuming 96 DPI)
         width_px, height_px = self._parse_dimensions(page_width, page_height)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page()
+        page = self._ensure_browser().new_page()
+        try:
             page.goto(f"file://{html_path.absolute()}")
-            page.pdf(
-                path=str(pdf_path),
+            return page.pdf(
                 width=f"{width_px}px",
                 height=f"{height_px}px",
                 print_background=True,
                 margin={"top": "0", "right": "0", "bottom": "0", "left": "0"}
             )
-            browser.close()
+        finally:
+            page.close()
 
-    def _convert_with_pdfkit(self, html_path: Path, pdf_path: Path,
-                            page_width: str, page_height: str):
+    def _convert_with_pdfkit(self, html_path: Path, page_width: str, page_height: str) -> bytes:
         """Convert using pdfkit (wkhtmltopdf wrapper)"""
         import pdfkit
 
-        options = {
+        # An output path of False makes pdfkit return the PDF instead of writing it
+        return pdfkit.from_file(str(html_path), False, options=self._pdfkit_options(page_width, page_height))
+
+    def _convert_many_with_pdfkit(self, html_paths: List[str], pdf_path: Path,
+                                  page_width: str, page_height: str):
+        """Render several HTML files into one PDF with a single wkhtmltopdf process"""
+        import pdfkit
+
+        pdfkit.from_file([str(html_path) for html_path in html_paths], str(pdf_path),
+                         options=self._pdfkit_options(page_width, page_height))
+
+    def _pdfkit_options(self, page_width: str, page_height: str) -> dict:
+        """wkhtmltopdf options for borderless pages of the given size"""
+        return {
             'page-width': page_width,
             'page-height': page_height,
             'margin-top': '0',
@@ -153,25 +435,9 @@ class HTMLtoPDFConverter:
             'enable-local-file-access': None
         }
 
-        pdfkit.from_file(str(html_path), str(pdf_path), options=options)
-
     def _parse_dimensions(self, width: str, height: str) -> tuple:
         """Parse dimension strings to pixels (96 DPI)"""
-        def to_pixels(dim: str) -> int:
-            if dim.endswith('in'):
-                return int(float(dim[:-2]) * 96)
-            elif dim.endswith('px'):
-                return int(float(dim[:-2]))
-            elif dim.endswith('pt'):
-                return int(float(dim[:-2]) * 96 / 72)
-            elif dim.endswith('mm'):
-                return int(float(dim[:-2]) * 96 / 25.4)
-            elif dim.endswith('cm'):
-                return int(float(dim[:-2]) * 96 / 2.54)
-            else:
-                return int(float(dim))
-
-        return to_pixels(width), to_pixels(height)
+        return _to_pixels(width), _to_pixels(height)
 
     def merge_pdfs(self, pdf_paths: List[str], output_path: str = None) -> str:
         """
@@ -184,11 +450,42 @@ class HTMLtoPDFConverter:
         Returns:
             Path to the merged PDF file
         """
-        try:
-            import PyPDF2
-        except ImportError:
-            raise ImportError("PyPDF2 not installed. Install with: pip install PyPDF2")
+        pdf_writer = _new_pdf_writer()
+
+        logger.info("Merging %s PDF files...", len(pdf_paths))
+
+        for pdf_path in pdf_paths:
+            if not os.path.exists(pdf_path):
+                logger.warning("  ⚠ PDF not found: %s", pdf_path)
+                continue
+
+            logger.debug("  Adding: %s", Path(pdf_path).name)
+            pdf_writer.append(pdf_path)
+
+        return self._write_merged(pdf_writer, output_path)
+
+    def merge_pdfs_from_bytes(self, pdf_documents: List[bytes], output_path: str = None) -> str:
+        """
+        Merge in-memory PDF documents into one file
+
+        Args:
+            pdf_documents: PDF documents as bytes, in output order
+            output_path: Path to output merged PDF
+
+        Returns:
+            Path to the merged PDF file
+        """
+        pdf_writer = _new_pdf_writer()
 
+        logger.info("Merging %s PDF documents...", len(pdf_documents))
+
+        for pdf_bytes in pdf_documents:
+            pdf_writer.append(io.BytesIO(pdf_bytes))
+
+        return self._write_merged(pdf_writer, output_path)
+
+    def _write_merged(self, pdf_writer, output_path: Optional[str]) -> str:
+        """Write a merged PdfWriter to its output file"""
         if output_path is None:
             output_path = Path("output/merged_document.pdf")
         else:
@@ -196,28 +493,17 @@ class HTMLtoPDFConverter:
 
         output_path.parent.mkdir(exist_ok=True, parents=True)
 
-        print(f"\nMerging {len(pdf_paths)} PDF files...")
-
-        pdf_merger = PyPDF2.PdfMerger()
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as output_file:
+            pdf_writer.write(output_file)
 
-        for pdf_path in pdf_paths:
-            if not os.path.exists(pdf_path):
-                print(f"  ⚠ Warning: PDF not found: {pdf_path}")
-                continue
+        pdf_writer.close()
 
-            print(f"  Adding: {Path(pdf_path).name}")
-            pdf_merger.append(pdf_path)
-
-        with open(output_path, 'wb') as output_file:
-            pdf_merger.write(output_file)
-
-        pdf_merger.close()
-
-        print(f"  ✓ Merged PDF saved to: {output_path}")
+        logger.info("  ✓ Merged PDF saved to: %s", output_path)
         return str(output_path)
 
     def convert_and_merge_html_pages(self, html_paths: List[str], output_path: str = None,
-                                    page_width: str = "8.5in", page_height: str = "11in") -> str:
+                                    page_width: str = "8.5in", page_height: str = "11in",
+                                    max_workers: int = None) -> str:
         """
         Convert multiple HTML pages to PDF and merge them
 
@@ -226,6 +512,8 @@ class HTMLtoPDFConverter:
             output_path: Path to output merged PDF
             page_width: Page width
             page_height: Page height
+            max_workers: Worker processes for page conversion (default: CPU count, at most
+                _MAX_PARALLEL_WORKERS and one per _PARALLEL_MIN_PAGES pages)
 
         Returns:
             Path to the merged PDF file
@@ -235,33 +523,45 @@ class HTMLtoPDFConverter:
         else:
             output_path = Path(output_path)
 
-        # Convert each HTML to PDF
-        pdf_paths = []
-        temp_dir = Path("output/temp_pdfs")
-        temp_dir.mkdir(exist_ok=True, parents=True)
-
-        for i, html_path in enumerate(html_paths, 1):
-            temp_pdf_path = temp_dir / f"page_{i}.pdf"
-            pdf_path = self.convert_html_to_pdf(html_path, str(temp_pdf_path), page_width, page_height)
-            pdf_paths.append(pdf_path)
+        # Playwright stays on the render-and-merge path below: each generated page carries its own
+        # <title>, stylesheet and .page size, and the body's flex layout would put every page of a
+        # combined document into one row, so pages cannot be concatenated into a single print
+        if self.method in ("weasyprint", "pdfkit") and html_paths:
+            # WeasyPrint and wkhtmltopdf lay out every page into one document, so there is nothing to merge
+            for html_path in html_paths:
+                if not os.path.exists(html_path):
+                    raise FileNotFoundError(f"HTML file not found: {html_path}")
+            output_path.parent.mkdir(exist_ok=True, parents=True)
+
+            logger.info("Converting %s HTML pages to PDF...", len(html_paths))
+            if self.method == "weasyprint":
+                self._convert_many_with_weasyprint(html_paths, output_path, page_width, page_height)
+            else:
+                self._convert_many_with_pdfkit(html_paths, output_path, page_width, page_height)
 
-        # Merge all PDFs
-        merged_path = self.merge_pdfs(pdf_paths, str(output_path))
+            logger.info("  ✓ PDF saved to: %s", output_path)
+            return str(output_path)
 
-        # Clean up temporary PDFs
-        print("\nCleaning up temporary files...")
-        for pdf_path in pdf_paths:
-            try:
-                os.remove(pdf_path)
-            except:
-                pass
+        # Convert each HTML to PDF in memory
+        workers = 1 if self.method == "skip" else _pool_size(len(html_paths), max_workers)
 
         try:
-            temp_dir.rmdir()
-        except:
-            pass
+            if workers == 1:
+                pdf_documents = [self.convert_html_to_pdf_bytes(html_path, page_width, page_height)
+                                 for html_path in html_paths]
+            else:
+                # Pages render independently, so each worker converts a contiguous share with one browser
+                share_size = -(-len(html_paths) // workers)
+                shares = [(self.method, html_paths[i:i + share_size], page_width, page_height)
+                          for i in range(0, len(html_paths), share_size)]
+                with ProcessPoolExecutor(max_workers=len(shares)) as executor:
+                    pdf_documents = [pdf_bytes for share in executor.map(_convert_share, shares)
+                                     for pdf_bytes in share]
+        finally:
+            self.close()
 
-        return merged_path
+        # Merge all PDFs
+        return self.merge_pdfs_from_bytes(pdf_documents, str(output_path))
 
     def convert_multi_page_html_to_pdf(self, html_path: str, output_path: str = None,
                                       page_width: str = "8.5in", page_height: str = "11in") -> str:
@@ -281,6 +581,15 @@ class HTMLtoPDFConverter:
         return self.convert_html_to_pdf(html_path, output_path, page_width, page_height)
 
 
+def _convert_share(task: tuple) -> List[bytes]:
+    """Convert a (method, html_paths, page_width, page_height) share of pages (process pool worker)"""
+    method, html_paths, page_width, page_height = task
+    # One converter per share so a Playwright browser persists across its pages and is closed after
+    with HTMLtoPDFConverter(method=method) as converter:
+        return [converter.convert_html_to_pdf_bytes(html_path, page_width, page_height)
+                for html_path in html_paths]
+
+
 def main():
     """Example usage"""
     import argparse
@@ -296,6 +605,8 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     converter = HTMLtoPDFConverter(method=args.method)
 
     if args.merge:
@@ -3,12 +3,39 @@ Image Processing Module
 Handles image cropping, optimization, and preparation for HTML embedding
 """
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
 from PIL import Image
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _content_lut(white_threshold: int, bands: int) -> list:
+    """Per-band lookup table marking channel values below the threshold, for point()"""
+    return ([255] * white_threshold + [0] * (256 - white_threshold)) * bands
+
+
+def _save_image(img: Image.Image, path: Path, quality: int, compress_level: int):
+    """
+    Save with explicit encoder settings rather than optimize=True
+
+    optimize=True makes PNG try every filter at zlib level 9 and JPEG run an extra
+    Huffman pass, which dominates save time on large scans.
+    """
+    suffix = path.suffix.lower()
+    if suffix == '.png':
+        img.save(path, compress_level=compress_level)
+    elif suffix in ('.jpg', '.jpeg'):
+        img.save(path, quality=quality, subsampling='4:2:0', optimize=False)
+    else:
+        img.save(path, quality=quality, optimize=True)
+
 
 class ImageProcessor:
     """Process images for optimal HTML display"""
@@ -17,41 +44,51 @@ class ImageProcessor:
         """Initialize image processor"""
         pass
 
-    def crop_whitespace(self, image_path: str, padding: int = 10) -> str:
+    def crop_whitespace(self, image_path: str, padding: int = 10, use_numpy: bool = False) -> str:
         """
         Crop whitespace from image borders and save as new file
 
         Args:
             image_path: Path to input image
             padding: Pixels to keep around content (default: 10)
+            use_numpy: Detect content with the NumPy implementation instead of PIL's (default: False)
 
         Returns:
             Path to cropped image file
         """
-        if not os.path.exists(image_path):
-            print(f"Warning: Image not found: {image_path}")
+        input_path = Path(image_path)
+        try:
+            original_size = input_path.stat().st_size
+        except OSError:
+            logger.warning("Image not found: %s", image_path)
             return image_path
 
         try:
-            # Open image
+            # Open image (Pillow decodes JPEG with libjpeg-turbo, so its SIMD IDCT is already in use)
             img = Image.open(image_path)
 
-            # Convert to RGB if needed (handles RGBA, grayscale, etc.)
-            if img.mode != 'RGB':
+            # RGB and grayscale are scanned as they are; converting would copy the whole image
+            if img.mode == 'RGBA':
+                # Transparent areas are background, so flatten onto white rather than dropping alpha
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel('A'))
+                img = background
+            elif img.mode not in ('RGB', 'L'):
                 img = img.convert('RGB')
 
-            # Convert to numpy array for processing
-            img_array = np.array(img)
-
             # Calculate bounding box of non-white content
-            bbox = self._find_content_bbox(img_array)
+            if use_numpy:
+                # Read-only view of the pixel data; np.array would copy the full-resolution buffer a second time
+                bbox = self._find_content_bbox(np.asarray(img))
+            else:
+                bbox = self._find_content_bbox_pil(img)
 
             if bbox is None:
-                print(f"  ⚠ Could not detect content boundaries in {Path(image_path).name}")
+                logger.warning("  ⚠ Could not detect content boundaries in %s", input_path.name)
                 return image_path
 
             # Add padding
-            height, width = img_array.shape[:2]
+            width, height = img.size
             x1, y1, x2, y2 = bbox
 
             x1 = max(0, x1 - padding)
@@ -63,25 +100,86 @@ class ImageProcessor:
             cropped_img = img.crop((x1, y1, x2, y2))
 
             # Generate output path
-            input_path = Path(image_path)
             output_path = input_path.parent / f"{input_path.stem}_cropped{input_path.suffix}"
 
             # Save cropped image
-            cropped_img.save(output_path, quality=95, optimize=True)
+            _save_image(cropped_img, output_path, quality=95, compress_level=1)
 
             # Calculate size reduction
-            original_size = os.path.getsize(image_path)
-            cropped_size = os.path.getsize(output_path)
+            cropped_size = output_path.stat().st_size
             reduction = ((original_size - cropped_size) / original_size) * 100
 
-            print(f"  ✓ Cropped: {input_path.name}")
-            print(f"    Original: {width}x{height} → Cropped: {x2-x1}x{y2-y1}")
-            print(f"    Size: {original_size//1024}KB → {cropped_size//1024}KB ({reduction:.1f}% reduction)")
+            logger.debug("  ✓ Cropped: %s", input_path.name)
+            logger.debug("    Original: %dx%d → Cropped: %dx%d", width, height, x2 - x1, y2 - y1)
+            logger.debug("    Size: %dKB → %dKB (%.1f%% reduction)", original_size // 1024, cropped_size // 1024, reduction)
 
             return str(output_path)
 
         except Exception as e:
-            print(f"  ✗ Error cropping {Path(image_path).name}: {e}")
+            logger.error("  ✗ Error cropping %s: %s", input_path.name, e)
+            return image_path
+
+    def crop_whitespace_vips(self, image_path: str, padding: int = 10) -> str:
+        """
+        Crop whitespace with libvips, streaming the image instead of decoding it into memory
+
+        Requires pyvips and the libvips system library. Unlike crop_whitespace, find_trim
+        median-filters before thresholding, so isolated specks a few pixels across are not
+        treated as content, and the output keeps the input's bands (alpha, grayscale).
+
+        Args:
+            image_path: Path to input image
+            padding: Pixels to keep around content (default: 10)
+
+        Returns:
+            Path to cropped image file
+        """
+        import pyvips
+
+        input_path = Path(image_path)
+        try:
+            original_size = input_path.stat().st_size
+        except OSError:
+            logger.warning("Image not found: %s", image_path)
+            return image_path
+
+        try:
+            # Sequential access streams the decode; find_trim consumes it, so the crop reopens the file
+            img = pyvips.Image.new_from_file(image_path, access="sequential")
+            left, top, trim_width, trim_height = img.find_trim(threshold=255 - 240, background=[255, 255, 255])
+
+            if trim_width == 0 or trim_height == 0:
+                logger.warning("  ⚠ Could not detect content boundaries in %s", input_path.name)
+                return image_path
+
+            # Add padding
+            width, height = img.width, img.height
+            x1 = max(0, left - padding)
+            y1 = max(0, top - padding)
+            x2 = min(width, left + trim_width + padding)
+            y2 = min(height, top + trim_height + padding)
+
+            # Generate output path
+            output_path = input_path.parent / f"{input_path.stem}_cropped{input_path.suffix}"
+
+            # Crop and save in one pipeline, with the same encoder settings as crop_whitespace
+            suffix = input_path.suffix.lower()
+            save_options = {'compression': 1} if suffix == '.png' else {'Q': 95} if suffix in ('.jpg', '.jpeg') else {}
+            cropped = pyvips.Image.new_from_file(image_path, access="sequential").crop(x1, y1, x2 - x1, y2 - y1)
+            cropped.write_to_file(str(output_path), **save_options)
+
+            # Calculate size reduction
+            cropped_size = output_path.stat().st_size
+            reduction = ((original_size - cropped_size) / original_size) * 100
+
+            logger.debug("  ✓ Cropped: %s", input_path.name)
+            logger.debug("    Original: %dx%d → Cropped: %dx%d", width, height, x2 - x1, y2 - y1)
+            logger.debug("    Size: %dKB → %dKB (%.1f%% reduction)", original_size // 1024, cropped_size // 1024, reduction)
+
+            return str(output_path)
+
+        except pyvips.Error as e:
+            logger.error("  ✗ Error cropping %s: %s", input_path.name, e)
             return image_path
 
     def _find_content_bbox(self, img_array: np.ndarray,
@@ -90,43 +188,61 @@ class ImageProcessor:
         Find bounding box of non-white content in image
 
         Args:
-            img_array: Image as numpy array (H, W, 3)
+            img_array: Image as numpy array, (H, W, 3) for RGB or (H, W) for grayscale
             white_threshold: Pixel value above which is considered white (0-255)
 
         Returns:
             Tuple of (x1, y1, x2, y2) or None if no content found
         """
-        # Create mask of non-white pixels
-        # Pixel is "white" if all RGB channels are >= threshold
-        is_white = np.all(img_array >= white_threshold, axis=2)
-        is_content = ~is_white
+        # Pixel is "white" if all RGB channels are >= threshold, i.e. its darkest channel is.
+        # Element-wise minimum over channel views is much faster than min(axis=2) on the inner axis.
+        if img_array.ndim == 2:
+            darkest = img_array
+        else:
+            darkest = np.minimum(img_array[..., 0], img_array[..., 1])
+            np.minimum(darkest, img_array[..., 2], out=darkest)
+
+        # Find rows and columns with content by thresholding the 1-D minima, not an (H, W) mask
+        rows_with_content = darkest.min(axis=1) < white_threshold
+        cols_with_content = darkest.min(axis=0) < white_threshold
+
+        # argmax stops at the first True; an all-False projection means no content
+        y1 = int(rows_with_content.argmax())
+        if not rows_with_content[y1]:
+            return None
+        x1 = int(cols_with_content.argmax())
 
-        # Find rows and columns with content
-        rows_with_content = np.any(is_content, axis=1)
-        cols_with_content = np.any(is_content, axis=0)
+        # Search the reversed projections for the last row/column with content
+        y2 = len(rows_with_content) - int(rows_with_content[::-1].argmax())
+        x2 = len(cols_with_content) - int(cols_with_content[::-1].argmax())
 
-        # Find bounding box
-        if not np.any(rows_with_content) or not np.any(cols_with_content):
-            return None
+        return (x1, y1, x2, y2)
 
-        y_indices = np.where(rows_with_content)[0]
-        x_indices = np.where(cols_with_content)[0]
+    def _find_content_bbox_pil(self, img: Image.Image,
+                               white_threshold: int = 240) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Find bounding box of non-white content in an RGB or grayscale image without leaving PIL
 
-        y1 = y_indices[0]
-        y2 = y_indices[-1] + 1
-        x1 = x_indices[0]
-        x2 = x_indices[-1] + 1
+        Args:
+            img: RGB or L image
+            white_threshold: Pixel value above which is considered white (0-255)
 
-        return (x1, y1, x2, y2)
+        Returns:
+            Tuple of (x1, y1, x2, y2) or None if no content found
+        """
+        # Map each channel below the threshold to 255 and the rest to 0, so a pixel is
+        # non-zero exactly when some channel is non-white; getbbox finds its extent natively
+        return img.point(_content_lut(white_threshold, len(img.getbands()))).getbbox()
 
     def crop_all_images_in_directory(self, images_dir: str,
-                                     padding: int = 10) -> dict:
+                                     padding: int = 10, max_workers: int = None) -> dict:
         """
         Crop all images in a directory
 
         Args:
             images_dir: Directory containing images
             padding: Pixels to keep around content
+            max_workers: Threads cropping images concurrently (default: executor default)
 
         Returns:
             Dictionary mapping original paths to cropped paths
@@ -134,7 +250,7 @@ class ImageProcessor:
         images_dir = Path(images_dir)
 
         if not images_dir.exists():
-            print(f"Warning: Directory not found: {images_dir}")
+            logger.warning("Directory not found: %s", images_dir)
             return {}
 
         # Find all image files
@@ -145,17 +261,18 @@ class ImageProcessor:
         ]
 
         if not image_files:
-            print(f"No images found in {images_dir}")
+            logger.info("No images found in %s", images_dir)
             return {}
 
-        print(f"\nCropping {len(image_files)} images...")
+        logger.info("Cropping %s images...", len(image_files))
 
-        mapping = {}
-        for img_path in image_files:
-            cropped_path = self.crop_whitespace(str(img_path), padding=padding)
-            mapping[str(img_path)] = cropped_path
+        # PIL releases the GIL while decoding, scanning and encoding, so images crop concurrently
+        image_paths = [str(img_path) for img_path in image_files]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            cropped_paths = executor.map(lambda path: self.crop_whitespace(path, padding=padding), image_paths)
+            mapping = dict(zip(image_paths, cropped_paths))
 
-        print(f"✓ Completed cropping {len(image_files)} images")
+        logger.info("✓ Completed cropping %s images", len(image_files))
 
         return mapping
 
@@ -183,22 +300,22 @@ class ImageProcessor:
                 ratio = max_width / img.width
                 new_height = int(img.height * ratio)
                 img = img.resize((max_width, new_height), Image.LANCZOS)
-                print(f"  ↓ Resized to {max_width}x{new_height}")
+                logger.debug("  ↓ Resized to %dx%d", max_width, new_height)
 
             # Save optimized
             output_path = Path(image_path).parent / f"{Path(image_path).stem}_opt{Path(image_path).suffix}"
-            img.save(output_path, quality=quality, optimize=True)
+            _save_image(img, output_path, quality=quality, compress_level=6)
 
             original_size = os.path.getsize(image_path)
             opt_size = os.path.getsize(output_path)
             reduction = ((original_size - opt_size) / original_size) * 100
 
-            print(f"  ✓ Optimized: {original_size//1024}KB → {opt_size//1024}KB ({reduction:.1f}% reduction)")
+            logger.debug("  ✓ Optimized: %dKB → %dKB (%.1f%% reduction)", original_size // 1024, opt_size // 1024, reduction)
 
             return str(output_path)
 
         except Exception as e:
-            print(f"  ✗ Error optimizing {Path(image_path).name}: {e}")
+            logger.error("  ✗ Error optimizing %s: %s", Path(image_path).name, e)
             return image_path
 
     def crop_and_optimize(self, image_path: str, padding: int = 10,
@@ -237,7 +354,7 @@ def crop_extracted_images(output_dir: str, padding: int = 10):
     images_dir = Path(output_dir) / "extracted_images"
 
     if not images_dir.exists():
-        print(f"No extracted_images directory found in {output_dir}")
+        logger.warning("No extracted_images directory found in %s", output_dir)
         return
 
     processor = ImageProcessor()
@@ -250,6 +367,8 @@ if __name__ == "__main__":
     # Example usage
     import sys
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     if len(sys.argv) > 1:
         image_path = sys.argv[1]
         processor = ImageProcessor()
@@ -5,9 +5,29 @@ Focuses on converting data that has consistent headers across multiple records
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 
 
+# Table cell templates; %s is the escaped cell text (and, for data cells, first the row color)
+_TH_TEMPLATE = ('      <th style="text-align: left; padding: 8px; background-color: #4CAF50; color: white; '
+                'border: 1px solid #ddd; font-weight: bold;">%s</th>')
+_TD_TEMPLATE = ('      <td style="text-align: left; padding: 8px; border: 1px solid #ddd; '
+                'background-color: %s;">%%s</td>')
+_ROW_COLORS = ('#f9f9f9', '#ffffff')
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(converter_cls: type, text: str) -> Tuple[Tuple[str, ...], Tuple[Dict[str, str], ...]]:
+    """
+    Parse text once per converter class (the same paragraph is often inspected more than once)
+
+    The record dicts are shared between callers and must not be mutated.
+    """
+    headers, records = converter_cls()._analyze(text)
+    return (tuple(headers), tuple(records))
+
+
 class KeyValueConverter:
     """Converts multi-record dictionary text blocks into structured tables"""
 
@@ -40,31 +60,105 @@ class KeyValueConverter:
         Returns:
             Tuple of (is_multi_record, list_of_headers)
         """
+        headers, _ = _parse_cached(type(self), text)
+        return (bool(headers), list(headers))
+
+    def _analyze(self, text: str) -> Tuple[List[str], List[Dict[str, str]]]:
+        """
+        Split, tokenize and validate text in a single pass
+
+        Args:
+            text: Text content to analyze
+
+        Returns:
+            Tuple of (headers, list_of_record_dicts), or ([], []) if not a multi-record dictionary
+        """
         if not text or len(text.strip()) < 20:
-            return (False, [])
+            return ([], [])
+
+        # Cheap prefilter: every record needs at least 2 key-value lines, so prose with too few
+        # lines or separators can be rejected without splitting it
+        min_kv_lines = 2 * self.MIN_RECORDS
+        if text.strip().count('\n') < min_kv_lines - 1:
+            return ([], [])
+        if sum(text.count(sep) for sep in self.KV_SEPARATORS) < min_kv_lines:
+            return ([], [])
 
         # Split into potential records (separated by blank lines)
         records = self._split_into_records(text)
 
         if len(records) < self.MIN_RECORDS:
-            return (False, [])
+            return ([], [])
 
-        # Extract headers from each record
-        all_headers = []
+        # Tokenize record by record, stopping at the first whose headers (in order) differ
+        # from the first record's; tuple comparison rejects a length mismatch up front
+        first_headers = None
+        parsed_records = []
         for record in records:
-            headers = self._extract_headers_from_record(record)
-            if not headers or len(headers) < 2:  # Need at least 2 fields
-                return (False, [])
-            all_headers.append(headers)
+            entries = self._parse_record(record)
+            headers = tuple(key for key, _ in entries if key)
+            if first_headers is None:
+                if len(headers) < 2:  # Need at least 2 fields
+                    return ([], [])
+                first_headers = headers
+            elif headers != first_headers:
+                return ([], [])
+
+            # Build the record dict from the pairs parsed alongside the headers
+            record_dict = dict(pair for _, pair in entries if pair)
+            if record_dict:
+                parsed_records.append(record_dict)
+
+        if first_headers is None:
+            return ([], [])
+
+        return (list(first_headers), parsed_records)
+
+    def _parse_record(self, lines: List[str]) -> List[Tuple[Optional[str], Optional[Tuple[str, str]]]]:
+        """
+        Tokenize every non-blank line of a record once
+
+        Args:
+            lines: Lines of a single record
+
+        Returns:
+            A (header_key, (key, value)) entry for each non-blank line (see _parse_line)
+        """
+        entries = []
+        for line in lines:
+            line = line.strip()
+            if line:
+                entries.append(self._parse_line(line))
+        return entries
 
-        # Check if all records have the same headers (in same order)
-        if not self._have_consistent_headers(all_headers):
-            return (False, [])
+    def _parse_line(self, line: str) -> Tuple[Optional[str], Optional[Tuple[str, str]]]:
+        """
+        Tokenize a stripped key-value line
 
-        # Return the common headers
-        return (True, all_headers[0])
+        The header key is taken at the first separator giving a non-empty key under 50
+        characters, the (key, value) pair at the first separator giving a non-empty key
+        and value, which is not always the same separator.
 
-    def _split_into_records(self, text: str) -> List[str]:
+        Returns:
+            Tuple of (header_key or None, (key, value) or None)
+        """
+        header_key = None
+        pair = None
+        for sep in self.KV_SEPARATORS:
+            if sep in line:
+                key, value = line.split(sep, 1)
+                key = key.strip()
+                if header_key is None and key and len(key) < 50:
+                    header_key = key
+                if pair is None:
+                    value = value.strip()
+                    if key and value:
+                        pair = (key, value)
+                if header_key is not None and pair is not None:
+                    break
+        return (header_key, pair)
+
+    def _split_into_records(self, text: str) -> List[List[str]]:
         """
         Split text into records based on blank lines or repeated header patterns
 
@@ -72,7 +166,7 @@ class KeyValueConverter:
             text: Text content
 
         Returns:
-            List of record strings
+            List of records, each a list of its lines
         """
         # First try: split by blank lines
         records = []
@@ -84,14 +178,14 @@ class KeyValueConverter:
             if line.strip() == '':
                 # Blank line - end of record
                 if current_record:
-                    records.append('\n'.join(current_record))
+                    records.append(current_record)
                     current_record = []
             else:
                 current_record.append(line)
 
         # Add last record
         if current_record:
-            records.append('\n'.join(current_record))
+            records.append(current_record)
 
         # If we only got 1 record, try detecting repeated header patterns
         if len(records) < 2:
@@ -99,7 +193,7 @@ class KeyValueConverter:
 
         return records
 
-    def _split_by_repeated_headers(self, text: str) -> List[str]:
+    def _split_by_repeated_headers(self, text: str) -> List[List[str]]:
         """
         Detect repeated header patterns to split records
 
@@ -113,13 +207,11 @@ class KeyValueConverter:
         if len(lines) < 4:
             return []
 
+        # Tokenize each line once for both the first-key search and the split
+        keys = [self._extract_key_from_line(line) for line in lines]
+
         # Find first key
-        first_key = None
-        for line in lines:
-            key = self._extract_key_from_line(line)
-            if key:
-                first_key = key
-                break
+        first_key = next((key for key in keys if key), None)
 
         if not first_key:
             return []
@@ -128,79 +220,23 @@ class KeyValueConverter:
         records = []
         current_record = []
 
-        for line in lines:
-            key = self._extract_key_from_line(line)
-
+        for line, key in zip(lines, keys):
             if key == first_key and current_record:
                 # New record starts
-                records.append('\n'.join(current_record))
+                records.append(current_record)
                 current_record = [line]
             else:
                 current_record.append(line)
 
         # Add last record
         if current_record:
-            records.append('\n'.join(current_record))
+            records.append(current_record)
 
         return records if len(records) >= 2 else []
 
     def _extract_key_from_line(self, line: str) -> Optional[str]:
         """Extract key from a key-value line"""
-        line = line.strip()
-        for sep in self.KV_SEPARATORS:
-            if sep in line:
-                parts = line.split(sep, 1)
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    if key and len(key) < 50:
-                        return key
-        return None
-
-    def _extract_headers_from_record(self, record: str) -> List[str]:
-        """
-        Extract headers (keys) from a single record
-
-        Args:
-            record: Single record text
-
-        Returns:
-            List of header names (keys) in order
-        """
-        headers = []
-        lines = record.strip().split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Extract key from line
-            key = self._extract_key_from_line(line)
-            if key:
-                headers.append(key)
-
-        return headers
-
-    def _have_consistent_headers(self, all_headers: List[List[str]]) -> bool:
-        """
-        Check if all records have the same headers in the same order
-
-        Args:
-            all_headers: List of header lists from each record
-
-        Returns:
-            True if all headers match
-        """
-        if not all_headers:
-            return False
-
-        first_headers = all_headers[0]
-
-        for headers in all_headers[1:]:
-            if headers != first_headers:
-                return False
-
-        return True
+        return self._parse_line(line.strip())[0]
 
     def parse_multi_record_dictionary(self, text: str) -> Tuple[List[str], List[Dict[str, str]]]:
         """
@@ -212,38 +248,8 @@ class KeyValueConverter:
         Returns:
             Tuple of (headers, list_of_record_dicts)
         """
-        is_multi_record, headers = self.detect_multi_record_dictionary(text)
-
-        if not is_multi_record:
-            return ([], [])
-
-        records = self._split_into_records(text)
-        parsed_records = []
-
-        for record in records:
-            record_dict = {}
-            lines = record.strip().split('\n')
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Parse key-value
-                for sep in self.KV_SEPARATORS:
-                    if sep in line:
-                        parts = line.split(sep, 1)
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = parts[1].strip()
-                            if key and value:
-                                record_dict[key] = value
-                                break
-
-            if record_dict:
-                parsed_records.append(record_dict)
-
-        return (headers, parsed_records)
+        headers, records = _parse_cached(type(self), text)
+        return (list(headers), [dict(record) for record in records])
 
     def convert_to_html_table(self, text: str, caption: str = None) -> str:
         """
@@ -256,40 +262,34 @@ class KeyValueConverter:
         Returns:
             HTML table string or None if not convertible
         """
-        headers, records = self.parse_multi_record_dictionary(text)
+        headers, records = _parse_cached(type(self), text)
+        return self._build_html_table(headers, records, caption)
 
+    def _build_html_table(self, headers: Tuple[str, ...], records: Tuple[Dict[str, str], ...],
+                          caption: str = None) -> Optional[str]:
+        """Render parsed records as an HTML table, or None if there are too few"""
         if not headers or len(records) < self.MIN_RECORDS:
             return None
 
+        escape = self._escape_html
         html_parts = ['<table style="border-collapse: collapse; width: 100%;">']
 
         # Add caption if provided
         if caption:
-            html_parts.append(f'  <caption>{self._escape_html(caption)}</caption>')
+            html_parts.append(f'  <caption>{escape(caption)}</caption>')
 
         # Add header row
-        html_parts.append('  <thead>')
-        html_parts.append('    <tr>')
-        for header in headers:
-            header_escaped = self._escape_html(header)
-            html_parts.append(f'      <th style="text-align: left; padding: 8px; background-color: #4CAF50; color: white; border: 1px solid #ddd; font-weight: bold;">{header_escaped}</th>')
-        html_parts.append('    </tr>')
-        html_parts.append('  </thead>')
-
-        # Add data rows
-        html_parts.append('  <tbody>')
-        for i, record in enumerate(records):
-            # Alternate row colors for better readability
-            bg_color = '#f9f9f9' if i % 2 == 0 else '#ffffff'
-            html_parts.append('    <tr>')
-            for header in headers:
-                value = record.get(header, '')
-                value_escaped = self._escape_html(value)
-                html_parts.append(f'      <td style="text-align: left; padding: 8px; border: 1px solid #ddd; background-color: {bg_color};">{value_escaped}</td>')
-            html_parts.append('    </tr>')
-        html_parts.append('  </tbody>')
-
-        html_parts.append('</table>')
+        html_parts.append('  <thead>\n    <tr>')
+        html_parts.append('\n'.join(_TH_TEMPLATE % escape(header) for header in headers))
+        html_parts.append('    </tr>\n  </thead>\n  <tbody>')
+
+        # Add data rows (alternate row colors for better readability), one template per color
+        row_templates = ['    <tr>\n' + '\n'.join([_TD_TEMPLATE % bg_color] * len(headers)) + '\n    </tr>'
+                         for bg_color in _ROW_COLORS]
+        html_parts.extend(row_templates[i % 2] % tuple(escape(record.get(header, '')) for header in headers)
+                          for i, record in enumerate(records))
+
+        html_parts.append('  </tbody>\n</table>')
 
         return '\n'.join(html_parts)
 
@@ -298,18 +298,10 @@ class KeyValueConverter:
         if not text:
             return text
 
-        replacements = {
-            '&': '&amp;',
-            '<': '&lt;',
-            '>': '&gt;',
-            '"': '&quot;',
-            "'": '&#39;'
-        }
-
-        for char, escape in replacements.items():
-            text = text.replace(char, escape)
-
-        return text
+        # Chained str.replace beats a str.translate table here: each call is a C-level scan
+        # that returns the same string untouched when the character is absent
+        return (text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                .replace('"', '&quot;').replace("'", '&#39;'))
 
     def convert_content_item(self, content_item: Dict) -> Dict:
         """
@@ -327,13 +319,13 @@ class KeyValueConverter:
 
         text = content_item.get('content', '')
 
-        # Check if it's a multi-record dictionary
-        is_multi_record, headers = self.detect_multi_record_dictionary(text)
-        if not is_multi_record:
+        # Check if it's a multi-record dictionary (parsed once for detection, table and metadata)
+        headers, records = _parse_cached(type(self), text)
+        if not headers:
             return content_item
 
         # Convert to table
-        table_html = self.convert_to_html_table(text)
+        table_html = self._build_html_table(headers, records)
 
         if not table_html:
             return content_item
@@ -348,11 +340,10 @@ class KeyValueConverter:
         if 'metadata' not in table_item:
             table_item['metadata'] = {}
 
-        _, records = self.parse_multi_record_dictionary(text)
         table_item['metadata']['row_count'] = len(records)
         table_item['metadata']['column_count'] = len(headers)
         table_item['metadata']['converted_from_kv'] = True
-        table_item['metadata']['headers'] = headers
+        table_item['metadata']['headers'] = list(headers)
 
         return table_item
 
@@ -370,29 +361,26 @@ class KeyValueConverter:
             return content
 
         converted_items = []
-        conversion_count = 0
+        converted_tables = []
 
         for item in content['content_items']:
             converted_item = self.convert_content_item(item)
             converted_items.append(converted_item)
 
-            # Track conversions
+            # Track conversions as they happen rather than re-scanning the items afterwards
             if converted_item.get('type') == 'table' and \
                converted_item.get('metadata', {}).get('converted_from_kv'):
-                conversion_count += 1
+                converted_tables.append(converted_item)
 
         content['content_items'] = converted_items
 
         # Update legacy format (tables list)
-        if conversion_count > 0:
+        if converted_tables:
             if 'tables' not in content:
                 content['tables'] = []
 
             # Add converted tables to tables list
-            for item in converted_items:
-                if item.get('type') == 'table' and \
-                   item.get('metadata', {}).get('converted_from_kv'):
-                    content['tables'].append(item)
+            content['tables'].extend(converted_tables)
 
         return content
 
@@ -6,6 +6,7 @@ PDF → PNG → Content Extraction → HTML → PDF
 
 import os
 import json
+import logging
 from pathlib import Path
 from typing import List, Dict, Optional, Callable
 from dotenv import load_dotenv
@@ -717,6 +718,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Show progress messages from modules that report through logging
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # Get API key from args or environment
     api_key = args.api_key or os.getenv('OPENAI_API_KEY')
 
@@ -4,6 +4,7 @@ User-friendly interface for PDF content extraction with structure preservation
 """
 
 import streamlit as st
+import logging
 import os
 import sys
 from pathlib import Path
@@ -15,6 +16,9 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Show progress messages from modules that report through logging
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -0,0 +1,124 @@
+"""
+Test script for HTML Generator V2
+Validates that extracted text is HTML-escaped while table markup is kept as-is
+"""
+
+import re
+import tempfile
+from pathlib import Path
+
+from html_generator_v2 import HTMLPageGenerator
+
+
+def _generate(content: dict) -> str:
+    """Generate a page and return its HTML"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "page.html"
+        HTMLPageGenerator().generate_page_html(content, None, str(output_path))
+        return output_path.read_text(encoding='utf-8')
+
+
+def test_text_is_escaped():
+    """Test that <, > and & in extracted text come out escaped"""
+    print("=" * 70)
+    print("TEST 1: Text Escaping")
+    print("=" * 70)
+
+    table_html = '<table><tr><td>Oil & Gas</td><td><b>A</b></td></tr></table>'
+    content = {
+        "page_num": 1,
+        "content_items": [
+            {"order": 1, "type": "paragraph", "content": "Royalty < 1/8 & interest > 0"},
+            {"order": 2, "type": "paragraph", "content": "Bold <i>not markup</i>",
+             "formatting": {"bold": True}},
+            {"order": 3, "type": "table", "content": table_html,
+             "metadata": {"caption": "Table <1> & notes"}},
+            {"order": 4, "type": "image",
+             "metadata": {"description": "Map of <tract> & wells", "caption": "Figure 1 > plat"}},
+        ]
+    }
+
+    html = _generate(content)
+
+    assert "<p class=\"justified\">Royalty &lt; 1/8 &amp; interest &gt; 0</p>" in html, "Paragraph text should be escaped"
+    assert "<strong>Bold &lt;i&gt;not markup&lt;/i&gt;</strong>" in html, \
+        "Formatted text should be escaped inside its formatting tags"
+    assert "Table &lt;1&gt; &amp; notes" in html, "Table caption should be escaped"
+    assert "Map of &lt;tract&gt; &amp; wells" in html, "Image description should be escaped"
+    assert "Figure 1 &gt; plat" in html, "Image caption should be escaped"
+    assert table_html in html, "Table HTML should be inserted unescaped"
+
+    print("✅ PASS: Content items escaped, table HTML kept raw\n")
+
+
+def test_legacy_text_is_escaped():
+    """Test escaping for the legacy text_blocks/tables/images format"""
+    print("=" * 70)
+    print("TEST 2: Legacy Format Escaping")
+    print("=" * 70)
+
+    table_html = '<table><tr><td>R&D</td></tr></table>'
+    content = {
+        "page_num": 1,
+        "text_blocks": [
+            {"order": 1, "type": "header", "level": 2, "content": "Terms & <Conditions>"},
+            {"order": 2, "type": "paragraph", "content": "a < b"},
+        ],
+        "tables": [{"order": 3, "html": table_html, "caption": "Costs & fees"}],
+        "images": [{"order": 4, "description": "Logo <svg>", "caption": ""}],
+    }
+
+    html = _generate(content)
+
+    assert "<h2>Terms &amp; &lt;Conditions&gt;</h2>" in html, "Header text should be escaped"
+    assert "<p>a &lt; b</p>" in html, "Paragraph text should be escaped"
+    assert "Costs &amp; fees" in html, "Table caption should be escaped"
+    assert "Logo &lt;svg&gt;" in html, "Image description should be escaped"
+    assert table_html in html, "Table HTML should be inserted unescaped"
+
+    print("✅ PASS: Legacy text escaped, table HTML kept raw\n")
+
+
+def test_justify_is_scoped_to_paragraphs():
+    """Test that only rendered paragraphs are justified, not every <p> on the page"""
+    print("=" * 70)
+    print("TEST 3: Paragraph Alignment Scope")
+    print("=" * 70)
+
+    content = {
+        "page_num": 1,
+        "content_items": [
+            {"order": 1, "type": "paragraph", "content": "Justified body text"},
+            {"order": 2, "type": "paragraph", "content": "Centered text",
+             "formatting": {"alignment": "center"}},
+            {"order": 3, "type": "table", "content": "<table><tr><td><p>Cell</p></td></tr></table>"},
+            {"order": 4, "type": "image", "metadata": {"description": "Site map"}},
+        ]
+    }
+
+    html = _generate(content)
+    p_rule = re.search(r'\n\s+p \{([^}]*)\}', html).group(1)
+
+    assert "text-align" not in p_rule, "The bare p rule should not set an alignment"
+    assert "p.justified {\n            text-align: justify;" in html, "Justify should be scoped to a class"
+    assert '<p class="justified">Justified body text</p>' in html, "Default paragraphs should use the class"
+    assert '<p style="text-align: center;">Centered text</p>' in html, "Other alignments stay inline"
+    assert "<td><p>Cell</p></td>" in html, "Table paragraphs should be left untouched"
+    assert '<p class="image-description">Site map</p>' in html, "Image descriptions keep their centering"
+
+    legacy = _generate({"page_num": 1, "text_blocks": [{"type": "paragraph", "content": "Legacy text"}]})
+    assert "<p>Legacy text</p>" in legacy, "Legacy paragraphs should not be justified"
+
+    print("✅ PASS: Justify limited to rendered paragraphs\n")
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running HTML Generator V2 Tests\n")
+
+    test_text_is_escaped()
+    test_legacy_text_is_escaped()
+    test_justify_is_scoped_to_paragraphs()
+
+    print("=" * 70)
+    print("✅ ALL TESTS PASSED!")
+    print("=" * 70)
@@ -0,0 +1,294 @@
+"""
+Test script for HTML to PDF Converter
+Validates page merging, browser lifecycle and the render cache with a stand-in Playwright browser
+(no Chromium needed)
+"""
+
+import io
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+from PyPDF2 import PdfReader, PdfWriter
+
+import html_to_pdf_converter
+from html_to_pdf_converter import HTMLtoPDFConverter, _clone_or_copy, _convert_share, _pool_size
+
+
+def _install_fake_playwright():
+    """Register a stand-in playwright.sync_api that records visited pages and prints blank PDFs"""
+    state = {'urls': [], 'launches': 0, 'stops': 0}
+
+    class FakePage:
+        def goto(self, url):
+            state['urls'].append(url)
+
+        def pdf(self, width, height, **kwargs):
+            writer = PdfWriter()
+            # Playwright sizes are CSS pixels (96 DPI); PDF units are points (72 DPI)
+            writer.add_blank_page(width=float(width[:-2]) * 0.75, height=float(height[:-2]) * 0.75)
+            buffer = io.BytesIO()
+            writer.write(buffer)
+            return buffer.getvalue()
+
+        def close(self):
+            pass
+
+    class FakeBrowser:
+        def new_page(self):
+            return FakePage()
+
+        def close(self):
+            pass
+
+    class FakeChromium:
+        def launch(self):
+            state['launches'] += 1
+            return FakeBrowser()
+
+    class FakeDriver:
+        chromium = FakeChromium()
+
+        def stop(self):
+            state['stops'] += 1
+
+    class FakeStarter:
+        def start(self):
+            return FakeDriver()
+
+    sync_api = types.ModuleType('playwright.sync_api')
+    sync_api.sync_playwright = FakeStarter
+    package = types.ModuleType('playwright')
+    package.sync_api = sync_api
+    sys.modules['playwright'] = package
+    sys.modules['playwright.sync_api'] = sync_api
+    return state
+
+
+def _remove_fake_playwright():
+    sys.modules.pop('playwright.sync_api', None)
+    sys.modules.pop('playwright', None)
+
+
+def _write_pages(directory: Path, count: int) -> list:
+    """Write minimal generated-style HTML pages, each with its own title"""
+    html_paths = []
+    for page_num in range(1, count + 1):
+        html_path = directory / f"page_{page_num}.html"
+        html_path.write_text(
+            f"<!DOCTYPE html>\n<html>\n<head>\n<title>Page {page_num}</title>\n</head>\n"
+            f"<body>\n<div class=\"page\">Page {page_num}</div>\n</body>\n</html>\n",
+            encoding='utf-8')
+        html_paths.append(str(html_path))
+    return html_paths
+
+
+def test_playwright_merge_renders_each_page():
+    """Test that Playwright merges print every page from its own document"""
+    print("=" * 70)
+    print("TEST 1: Playwright Page-by-Page Merge")
+    print("=" * 70)
+
+    state = _install_fake_playwright()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            html_paths = _write_pages(tmp, 3)
+
+            converter = HTMLtoPDFConverter(method="playwright")
+            converter._cache_dir = None
+            output = converter.convert_and_merge_html_pages(
+                html_paths, str(tmp / "merged.pdf"), page_width="8.5in", page_height="11in", max_workers=1)
+
+            reader = PdfReader(output)
+            print(f"  Pages printed: {len(state['urls'])}")
+            print(f"  Pages merged: {len(reader.pages)}")
+
+            expected_urls = [f"file://{Path(p).absolute()}" for p in html_paths]
+            assert state['urls'] == expected_urls, "Each page should be printed from its own HTML file"
+            assert len(reader.pages) == len(html_paths), "Merged PDF should have one page per HTML page"
+            assert float(reader.pages[0].mediabox.width) == 612, "Pages should keep the requested width"
+            assert converter._browser is None, "Browser should be closed after the merge"
+    finally:
+        _remove_fake_playwright()
+
+    print("✅ PASS: Playwright pages rendered and merged individually\n")
+
+
+def test_single_conversion_closes_browser():
+    """Test that converting one document does not leave Chromium running"""
+    print("=" * 70)
+    print("TEST 2: Browser Shutdown After Single Conversion")
+    print("=" * 70)
+
+    state = _install_fake_playwright()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            html_path = _write_pages(tmp, 1)[0]
+
+            converter = HTMLtoPDFConverter(method="playwright")
+            converter._cache_dir = None
+            converter.convert_multi_page_html_to_pdf(html_path, str(tmp / "document.pdf"))
+            converter.convert_multi_page_html_to_pdf(html_path, str(tmp / "document.pdf"))
+
+            print(f"  Browser launches: {state['launches']}, driver stops: {state['stops']}")
+            assert converter._browser is None and converter._pw is None, "Browser should be closed after converting"
+            assert state['stops'] == state['launches'] == 2, "Each conversion should stop the driver it started"
+    finally:
+        _remove_fake_playwright()
+
+    print("✅ PASS: Browser closed after each single conversion\n")
+
+
+def test_parallel_pool_sizing():
+    """Test that the page pool stays small and each worker's browser is closed"""
+    print("=" * 70)
+    print("TEST 3: Parallel Conversion Pool")
+    print("=" * 70)
+
+    print(f"  Workers for 5 pages on 32 CPUs: {_pool_size(5, 32)}")
+    assert _pool_size(3, None) == 1, "Small documents should convert in-process"
+    assert _pool_size(5, 32) == 1, "Each worker should get several pages"
+    assert _pool_size(8, 32) == 2, "Workers should scale with pages, not CPUs"
+    assert _pool_size(1000, 32) == html_to_pdf_converter._MAX_PARALLEL_WORKERS, "Workers should be capped"
+    assert _pool_size(1000, 1) == 1, "max_workers=1 should convert in-process"
+
+    state = _install_fake_playwright()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            html_paths = _write_pages(tmp, 8)
+            original_cache = os.environ.get("HTML2PDF_CACHE")
+            os.environ["HTML2PDF_CACHE"] = ""
+            try:
+                documents = _convert_share(("playwright", html_paths[:3], "8.5in", "11in"))
+                assert len(documents) == 3, "A share should return one PDF per page"
+                assert state['launches'] == state['stops'] == 1, "A share should use and close one browser"
+
+                converter = HTMLtoPDFConverter(method="playwright")
+                output = converter.convert_and_merge_html_pages(html_paths, str(tmp / "merged.pdf"),
+                                                                max_workers=2)
+            finally:
+                if original_cache is None:
+                    os.environ.pop("HTML2PDF_CACHE")
+                else:
+                    os.environ["HTML2PDF_CACHE"] = original_cache
+            assert len(PdfReader(output).pages) == 8, "Pool merge should keep every page"
+    finally:
+        _remove_fake_playwright()
+
+    print("✅ PASS: Pool sized by page count and browsers closed per share\n")
+
+
+def test_render_cache():
+    """Test cache hits, invalidation on asset changes, and pruning to the size cap"""
+    print("=" * 70)
+    print("TEST 4: Render Cache")
+    print("=" * 70)
+
+    state = _install_fake_playwright()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            image_path = tmp / "figure.png"
+            image_path.write_bytes(b"not really a png")
+            html_path = tmp / "page.html"
+            html_path.write_text('<html><body><img src="figure.png"></body></html>', encoding='utf-8')
+
+            converter = HTMLtoPDFConverter(method="playwright")
+            converter._cache_dir = tmp / "cache"
+
+            first = converter.convert_html_to_pdf_bytes(str(html_path))
+            second = converter.convert_html_to_pdf_bytes(str(html_path))
+            print(f"  Renders after two identical conversions: {len(state['urls'])}")
+            assert len(state['urls']) == 1, "Second conversion should be served from the cache"
+            assert first == second, "Cached render should match the original"
+
+            converter.convert_html_to_pdf(str(html_path), str(tmp / "copy.pdf"))
+            assert len(state['urls']) == 1, "File conversion should also be served from the cache"
+            assert (tmp / "copy.pdf").read_bytes() == first, "Cached PDF should be copied to the output"
+
+            # Changing a referenced image must trigger a re-render even though the HTML is unchanged
+            stat = image_path.stat()
+            os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            converter.convert_html_to_pdf_bytes(str(html_path))
+            print(f"  Renders after touching the image: {len(state['urls'])}")
+            assert len(state['urls']) == 2, "Asset mtime change should invalidate the cached render"
+
+            # With a cap smaller than two renders, storing a new one evicts the older
+            original_cap = html_to_pdf_converter._CACHE_MAX_BYTES
+            html_to_pdf_converter._CACHE_MAX_BYTES = len(first) + len(first) // 2
+            try:
+                converter.convert_html_to_pdf_bytes(str(html_path), page_width="5in")
+            finally:
+                html_to_pdf_converter._CACHE_MAX_BYTES = original_cap
+            cached = list((tmp / "cache").iterdir())
+            print(f"  Cached renders after pruning: {len(cached)}")
+            assert len(cached) == 1, "Cache should be pruned to its size cap"
+    finally:
+        _remove_fake_playwright()
+
+    print("✅ PASS: Render cache hits, invalidates and prunes correctly\n")
+
+
+def test_clone_or_copy():
+    """Test that cached PDFs are copied, not linked, into place"""
+    print("=" * 70)
+    print("TEST 5: Clone or Copy")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        src = tmp / "cached.pdf"
+        src.write_bytes(b"%PDF-1.4 cached" * 1000)
+
+        dst = tmp / "output.pdf"
+        _clone_or_copy(src, dst)
+        assert dst.read_bytes() == src.read_bytes(), "Copy should match the source"
+
+        # Rewriting the output in place must leave the cached file intact
+        with open(dst, 'r+b') as f:
+            f.write(b"overwritten")
+        assert src.read_bytes() == b"%PDF-1.4 cached" * 1000, "Source should not change with the copy"
+
+        # The regular copy fallback produces the same result
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        if copy_file_range is not None:
+            def failing_copy_file_range(*args):
+                raise OSError("cross-device copy")
+            os.copy_file_range = failing_copy_file_range
+            try:
+                fallback = tmp / "fallback.pdf"
+                _clone_or_copy(src, fallback)
+            finally:
+                os.copy_file_range = copy_file_range
+            assert fallback.read_bytes() == src.read_bytes(), "Fallback copy should match the source"
+
+    print("✅ PASS: Cached PDFs copied independently\n")
+
+
+def main():
+    """Run all tests"""
+    print("\n🧪 Running HTML to PDF Converter Tests\n")
+
+    try:
+        test_playwright_merge_renders_each_page()
+        test_single_conversion_closes_browser()
+        test_parallel_pool_sizing()
+        test_render_cache()
+        test_clone_or_copy()
+
+        print("=" * 70)
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 70)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}\n")
+        raise
+
+
+if __name__ == "__main__":
+    main()